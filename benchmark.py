@@ -0,0 +1,175 @@
+"""
+PSO - Benchmark de rendimiento y convergencia del motor
+Archivo: benchmark.py
+
+USO:
+python benchmark.py --particles 100 1000 --dimensions 2 30 \
+    --objectives sphere rastrigin --backends serial thread -o bench.json
+python benchmark.py --compare bench_base.json bench.json
+
+Métricas por caso (objetivo x backend x partículas x dimensiones):
+- updates_per_s: actualizaciones partícula-dimensión por segundo
+- evaluations_per_s: evaluaciones de la función de costo por segundo
+- peak_memory_mb: pico de memoria asignada (tracemalloc, en una pasada aparte
+  para no distorsionar el throughput)
+- time_to_target_s: tiempo hasta alcanzar el error objetivo (None si no se alcanza)
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# Importar la lógica del PSO
+from logic import PSOEngine, BENCHMARK_FUNCTIONS
+
+
+def git_revision():
+    """Obtener el commit actual (None si no se está en un repositorio git)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_engine(objective, backend, num_dimensions, bound, seed):
+    """Crear el motor de un caso con su posición inicial (reproducible por semilla)"""
+    bounds = [(-bound, bound)] * num_dimensions
+    engine = PSOEngine(cost_function=BENCHMARK_FUNCTIONS[objective], bounds=bounds,
+                       evaluator=backend, seed=seed)
+    initial_position = engine.rng.uniform(engine.lower_bounds, engine.upper_bounds)
+    return engine, initial_position
+
+
+def measure_peak_memory(objective, backend, num_particles, num_dimensions, iterations,
+                        bound, seed):
+    """Pico de memoria (bytes) de una ejecución idéntica, medido aparte con tracemalloc
+
+    tracemalloc ralentiza cada asignación, por lo que no se activa durante
+    la pasada cronometrada.
+    """
+    engine, initial_position = make_engine(objective, backend, num_dimensions, bound, seed)
+    tracemalloc.start()
+    try:
+        engine.initialize(initial_position, num_particles, iterations)
+        while engine.step():
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        engine.close()
+    return peak
+
+
+def benchmark_case(objective, backend, num_particles, num_dimensions, iterations,
+                   target_error, bound=5.0, seed=0):
+    """Medir throughput, memoria y tiempo hasta el objetivo de un caso"""
+    # Pasada cronometrada sin tracemalloc
+    engine, initial_position = make_engine(objective, backend, num_dimensions, bound, seed)
+    try:
+        engine.initialize(initial_position, num_particles, iterations)
+        time_to_target = None
+        start = time.perf_counter()
+        while engine.step():
+            # Registrar la primera vez que se alcanza el error objetivo
+            if time_to_target is None and engine.err_best_g <= target_error:
+                time_to_target = time.perf_counter() - start
+        elapsed = time.perf_counter() - start
+    finally:
+        engine.close()
+    stats = engine.get_stats()
+    # Pasada separada para la memoria
+    peak = measure_peak_memory(objective, backend, num_particles, num_dimensions, iterations,
+                               bound, seed)
+    return {
+        'objective': objective,
+        'backend': backend,
+        'particles': num_particles,
+        'dimensions': num_dimensions,
+        'iterations': stats['iteration'],
+        'elapsed_s': elapsed,
+        'updates_per_s': num_particles * num_dimensions * stats['iteration'] / elapsed,
+        'evaluations_per_s': stats['evaluations'] / elapsed,
+        'peak_memory_mb': peak / 2**20,
+        'best_error': stats['best_error'],
+        'time_to_target_s': time_to_target,
+    }
+
+
+def run_suite(objectives, backends, particles, dimensions, iterations, target_error):
+    """Ejecutar la matriz completa de casos y retornar el informe"""
+    results = []
+    for objective, n, d, backend in itertools.product(objectives, particles, dimensions, backends):
+        result = benchmark_case(objective, backend, n, d, iterations, target_error)
+        results.append(result)
+        t_target = result['time_to_target_s']
+        t_target = '-' if t_target is None else f'{t_target:.4f} s'
+        print(f"{objective:10s} {backend:8s} N={n:<7d} D={d:<4d} "
+              f"{result['updates_per_s']:12.3e} upd/s {result['evaluations_per_s']:12.3e} eval/s "
+              f"{result['peak_memory_mb']:8.1f} MB  t_objetivo={t_target}")
+    return {
+        'meta': {
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'iterations': iterations,
+            'target_error': target_error,
+        },
+        'results': results,
+    }
+
+
+def compare_reports(base, new):
+    """Imprimir la relación nuevo/base de throughput para los casos comunes"""
+    def key(r):
+        return (r['objective'], r['backend'], r['particles'], r['dimensions'])
+    base_results = {key(r): r for r in base['results']}
+    for r in new['results']:
+        b = base_results.get(key(r))
+        if b is None:
+            continue
+        ratio = r['updates_per_s'] / b['updates_per_s']
+        flag = '  <-- regresión' if ratio < 0.9 else ''
+        print(f"{r['objective']:10s} {r['backend']:8s} N={r['particles']:<7d} "
+              f"D={r['dimensions']:<4d} x{ratio:6.2f}{flag}")
+
+
+def main(argv=None):
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Benchmark del motor PSO')
+    parser.add_argument('--objectives', nargs='+', default=['sphere'],
+                        choices=list(BENCHMARK_FUNCTIONS))
+    parser.add_argument('--backends', nargs='+', default=['serial'],
+                        choices=['serial', 'thread', 'process'])
+    parser.add_argument('--particles', nargs='+', type=int, default=[100, 1000, 10000])
+    parser.add_argument('--dimensions', nargs='+', type=int, default=[2, 30])
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--target', type=float, default=1e-6, help='error objetivo')
+    parser.add_argument('-o', '--output', help='archivo JSON del informe')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NUEVO'),
+                        help='comparar dos informes JSON existentes')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f, open(args.compare[1]) as g:
+            compare_reports(json.load(f), json.load(g))
+        return 0
+
+    report = run_suite(args.objectives, args.backends, args.particles, args.dimensions,
+                       args.iterations, args.target)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
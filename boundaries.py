@@ -0,0 +1,86 @@
+"""
+PSO - Estrategias de manejo de límites del espacio de búsqueda
+Archivo: boundaries.py
+
+Cada estrategia implementa apply(positions, velocities, lower, upper, rng),
+que corrige en sitio las filas recibidas (vistas (n, D) del enjambre) tras
+sumar la velocidad a la posición. Todas son operaciones vectorizadas sobre
+el bloque completo.
+"""
+
+# Importar NumPy para las operaciones vectorizadas
+import numpy as np
+
+
+class Clamp:
+    """Recortar a los límites y conservar la velocidad (comportamiento original)"""
+
+    def apply(self, positions, velocities, lower, upper, rng):
+        np.clip(positions, lower, upper, out=positions)
+
+
+class Absorb:
+    """Recortar a los límites y anular la velocidad en las coordenadas que salieron"""
+
+    def apply(self, positions, velocities, lower, upper, rng):
+        outside = (positions < lower) | (positions > upper)
+        np.clip(positions, lower, upper, out=positions)
+        velocities[outside] = 0.0
+
+
+class Reflect:
+    """Reflejar en la pared e invertir la componente de velocidad que salió
+
+    El plegado con periodo 2·(upper - lower) resuelve también saltos que
+    cruzan la caja varias veces en una sola iteración: la velocidad se
+    invierte sólo si el número de paredes cruzadas es impar. Las coordenadas
+    dentro de los límites no se tocan.
+    """
+
+    def apply(self, positions, velocities, lower, upper, rng):
+        outside = (positions < lower) | (positions > upper)
+        if not outside.any():
+            return
+        lower = np.broadcast_to(lower, positions.shape)[outside]
+        width = np.broadcast_to(upper, positions.shape)[outside] - lower
+        # Posición relativa en anchos de caja: floor(t) cuenta las paredes cruzadas
+        t = (positions[outside] - lower) / width
+        odd = np.mod(np.floor(t), 2.0) == 1.0
+        positions[outside] = lower + width * (1.0 - np.abs(np.mod(t, 2.0) - 1.0))
+        velocities[outside] = np.where(odd, -velocities[outside], velocities[outside])
+
+
+class Periodic:
+    """Envolver periódicamente: salir por un lado equivale a entrar por el opuesto"""
+
+    def apply(self, positions, velocities, lower, upper, rng):
+        positions[...] = lower + np.mod(positions - lower, upper - lower)
+
+
+class RandomReinit:
+    """Reinicializar al azar (uniforme dentro de los límites) las coordenadas que salieron"""
+
+    def apply(self, positions, velocities, lower, upper, rng):
+        outside = (positions < lower) | (positions > upper)
+        if not outside.any():
+            return
+        random_positions = rng.uniform(lower, upper, size=positions.shape)
+        positions[outside] = random_positions[outside]
+
+
+# Estrategias disponibles por nombre
+BOUNDARIES = {
+    'clamp': Clamp,
+    'absorb': Absorb,
+    'reflect': Reflect,
+    'periodic': Periodic,
+    'random': RandomReinit,
+}
+
+
+def make_boundary(name):
+    """Crear una estrategia de límites desde su nombre"""
+    if name not in BOUNDARIES:
+        raise ValueError(f"Estrategia de límites desconocida: {name!r} "
+                         f"(opciones: {', '.join(BOUNDARIES)})")
+    return BOUNDARIES[name]()
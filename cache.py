@@ -0,0 +1,98 @@
+"""
+PSO - Caché de fitness con desalojo LRU
+Archivo: cache.py
+
+Las posiciones se cuantizan con una resolución configurable, de modo que
+puntos prácticamente idénticos (partículas pegadas a un límite o agrupadas
+alrededor del mejor global) reutilizan el error ya calculado.
+"""
+
+# Importar OrderedDict para mantener el orden de uso (LRU)
+from collections import OrderedDict
+# Importar NumPy para cuantizar las posiciones
+import numpy as np
+
+
+class FitnessCache:
+    """Caché de errores indexada por la posición cuantizada"""
+
+    def __init__(self, resolution=1e-9, max_size=100000):
+        # Tamaño de la celda de cuantización (posiciones en la misma celda comparten error)
+        self.resolution = resolution
+        # Número máximo de entradas antes de desalojar la menos usada
+        self.max_size = max_size
+        # Entradas clave -> error, ordenadas de menos a más recientemente usada
+        self._entries = OrderedDict()
+        # Contadores de aciertos y fallos
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def keys_for(self, positions):
+        """Calcular las claves cuantizadas de cada fila de la matriz de posiciones"""
+        cells = np.round(np.asarray(positions, dtype=float) / self.resolution).astype(np.int64)
+        return [row.tobytes() for row in cells]
+
+    def get(self, key):
+        """Buscar un error en la caché (None si no existe) y actualizar contadores"""
+        error = self._entries.get(key)
+        if error is None:
+            self.misses += 1
+            return None
+        # Marcar la entrada como la más recientemente usada
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return error
+
+    def put(self, key, error):
+        """Guardar un error y desalojar la entrada menos usada si se excede el tamaño"""
+        self._entries[key] = float(error)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def evaluate(self, positions, evaluate_fn):
+        """Evaluar la matriz de posiciones enviando a `evaluate_fn` sólo los fallos
+
+        Las filas repetidas dentro del mismo lote se evalúan una sola vez.
+        Retorna el vector de errores en el orden de las filas.
+        """
+        keys = self.keys_for(positions)
+        errors = np.empty(len(keys))
+        # Filas pendientes de evaluar: clave -> lista de filas que la comparten
+        pending = OrderedDict()
+        for i, key in enumerate(keys):
+            if key in pending:
+                # Repetida dentro del lote: se resuelve con la misma evaluación
+                pending[key].append(i)
+                self.hits += 1
+                continue
+            error = self.get(key)
+            if error is None:
+                pending[key] = [i]
+            else:
+                errors[i] = error
+        if pending:
+            # Evaluar sólo la primera fila de cada clave pendiente
+            rows = [indexes[0] for indexes in pending.values()]
+            new_errors = evaluate_fn(positions[rows])
+            for (key, indexes), error in zip(pending.items(), new_errors):
+                errors[indexes] = error
+                self.put(key, error)
+        return errors
+
+    def clear(self):
+        """Vaciar la caché y reiniciar contadores"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """Obtener estadísticas de uso de la caché"""
+        return {
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'cache_size': len(self._entries),
+        }
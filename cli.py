@@ -0,0 +1,289 @@
+"""
+PSO - Ejecución sin interfaz gráfica y barridos de experimentos
+Archivo: cli.py
+
+USO:
+python cli.py config.json [--output resultados.csv] [--workers 8]
+
+Ejemplo de archivo de configuración (JSON):
+{
+    "objective": "rastrigin",
+    "dimensions": 10,
+    "bound": [-5.12, 5.12],
+    "particles": 50,
+    "iterations": 500,
+    "seed": 1,
+    "backend": "serial",
+    "termination": {"target_error": 1e-8, "stagnation": {"iterations": 50}},
+    "sweep": {"particles": [20, 50, 100]},
+    "repeats": 10
+}
+
+- objective: nombre en BENCHMARK_FUNCTIONS o ruta "modulo:funcion"
+- multiobjective (opcional): true si la función objetivo retorna un vector
+  (automático para mopso.MULTIOBJECTIVE_FUNCTIONS: 'zdt1', 'zdt2', 'schaffer');
+  usa MOPSOEngine y agrega 'pareto_front' al resultado
+- archive_size + mutation_rate (opcional, multiobjetivo): capacidad del
+  archivo de Pareto e intensidad de la mutación decreciente
+- dimensions + bound, o bien "bounds": [[-5, 5], [-5, 5], ...]
+- iterations: máximo de iteraciones (null = sin límite, sólo criterios)
+- backend: evaluador 'serial', 'thread' o 'process'
+- termination (opcional): criterios de parada de criteria.CRITERIA
+- coefficients (opcional): 'constant', 'linear_inertia', 'constriction',
+  'adaptive_inertia' o {"linear_inertia": {"w_start": 0.9, "w_end": 0.4}}
+- v_max (opcional): velocidad máxima, escalar o una por dimensión
+- boundary (opcional): 'clamp', 'absorb', 'reflect', 'periodic' o 'random'
+- constraints (opcional): lista de restricciones g(x) <= 0 como "modulo:funcion"
+- constraint_handling (opcional): 'feasibility' (reglas de Deb, omite el objetivo
+  en partículas infactibles) o 'penalty', p. ej. {"penalty": {"coefficient": 1e4}}
+- topology (opcional): 'global', 'ring', 'von_neumann', 'random' o {"ring": {"k": 2}}
+- surrogate (opcional): sustituto que pre-filtra candidatos, p. ej.
+  {"knn": {"k": 5, "fraction": 0.5}} (sólo la mitad más prometedora se evalúa)
+- profile (opcional): true para incluir en el resultado los tiempos por fase,
+  evaluaciones e histograma de latencias (ver profiling.py)
+- dtype (opcional): 'float64' (por defecto) o 'float32' para las matrices del enjambre
+- history + history_capacity + history_every (opcional): archivo .npy mapeado en
+  memoria con las últimas `history_capacity` muestras de posiciones, una cada
+  `history_every` iteraciones (ver history.py); al reanudar desde un checkpoint
+  se conserva. En barridos y repeticiones se numera igual que el checkpoint
+- checkpoint + checkpoint_every (opcional): archivo .npz guardado cada N
+  iteraciones; si ya existe, la ejecución continúa desde él. En barridos y
+  repeticiones cada ejecución usa su propio archivo (ck.npz -> ck_0.npz, ck_1.npz, ...)
+- sweep (opcional): rejilla de parámetros a combinar
+- repeats (opcional): repeticiones con semillas seed, seed+1, ...
+"""
+
+import argparse
+import csv
+import importlib
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Importar la lógica del PSO
+from logic import PSOEngine, BENCHMARK_FUNCTIONS
+from criteria import make_criteria
+from topologies import make_topology
+from coefficients import make_coefficients
+from boundaries import make_boundary
+from constraints import make_constraint_handling
+from history import TrajectoryHistory
+from surrogate import make_surrogate
+from profiling import Profiler
+from mopso import MOPSOEngine, MULTIOBJECTIVE_FUNCTIONS
+
+
+# Valores por defecto de cada ejecución
+DEFAULT_CONFIG = {
+    'objective': 'sphere',
+    'dimensions': 2,
+    'bound': [-10, 10],
+    'particles': 15,
+    'iterations': 30,
+    'seed': None,
+    'backend': 'serial',
+    'initial_position': None,
+    'termination': {},
+    'checkpoint': None,
+    'checkpoint_every': 0,
+    'topology': 'global',
+    'coefficients': 'constant',
+    'v_max': None,
+    'boundary': 'clamp',
+    'constraints': [],
+    'constraint_handling': 'feasibility',
+    'surrogate': None,
+    'profile': False,
+    'multiobjective': False,
+    'archive_size': 100,
+    'mutation_rate': 0.5,
+    'dtype': 'float64',
+    'history': None,
+    'history_capacity': 1000,
+    'history_every': 1,
+}
+
+
+def resolve_objective(name):
+    """Obtener la función objetivo por nombre o por ruta 'modulo:funcion'"""
+    if name in BENCHMARK_FUNCTIONS:
+        return BENCHMARK_FUNCTIONS[name]
+    if name in MULTIOBJECTIVE_FUNCTIONS:
+        return MULTIOBJECTIVE_FUNCTIONS[name]
+    if ':' not in name:
+        raise ValueError(f"Función objetivo desconocida: {name!r} "
+                         f"(opciones: {', '.join([*BENCHMARK_FUNCTIONS, *MULTIOBJECTIVE_FUNCTIONS])}"
+                         f" o 'modulo:funcion')")
+    module_name, attr = name.split(':', 1)
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def resolve_bounds(config):
+    """Obtener la lista de límites (inferior, superior) de cada dimensión"""
+    if config.get('bounds'):
+        return [tuple(b) for b in config['bounds']]
+    return [tuple(config['bound'])] * int(config['dimensions'])
+
+
+def run_single(config):
+    """Ejecutar una optimización completa a máxima velocidad y retornar su resultado"""
+    config = {**DEFAULT_CONFIG, **config}
+    bounds = resolve_bounds(config)
+    # Modo multiobjetivo: MOPSOEngine con archivo de Pareto
+    multiobjective = config['multiobjective'] or config['objective'] in MULTIOBJECTIVE_FUNCTIONS
+    engine_options = {}
+    if multiobjective:
+        engine_options = {'archive_size': int(config['archive_size']),
+                          'mutation_rate': config['mutation_rate']}
+    engine_class = MOPSOEngine if multiobjective else PSOEngine
+    engine = engine_class(cost_function=resolve_objective(config['objective']),
+                          bounds=bounds, evaluator=config['backend'], seed=config['seed'],
+                          termination=make_criteria(config['termination']),
+                          checkpoint_path=config['checkpoint'],
+                          checkpoint_every=int(config['checkpoint_every']),
+                          topology=make_topology(config['topology']),
+                          coefficients=make_coefficients(config['coefficients']),
+                          v_max=config['v_max'],
+                          boundary=make_boundary(config['boundary']),
+                          constraints=[resolve_objective(name) for name in config['constraints']],
+                          constraint_handling=make_constraint_handling(config['constraint_handling']),
+                          dtype=config['dtype'],
+                          surrogate=make_surrogate(config['surrogate']) if config['surrogate'] else None,
+                          profiler=Profiler() if config['profile'] else None,
+                          **engine_options)
+    # Historial de trayectorias opcional en un búfer circular mapeado a disco
+    history = None
+    if config['history']:
+        history = TrajectoryHistory(int(config['history_capacity']), path=config['history'])
+        engine.add_observer(history.record, every=int(config['history_every']))
+    try:
+        # Posición inicial: la indicada o un punto aleatorio dentro de los límites
+        initial_position = config['initial_position']
+        if initial_position is None:
+            initial_position = engine.rng.uniform(engine.lower_bounds, engine.upper_bounds)
+        max_iterations = config['iterations']
+        if max_iterations is not None:
+            max_iterations = int(max_iterations)
+        engine.initialize(initial_position, int(config['particles']), max_iterations)
+        # Continuar desde un checkpoint previo si existe (máquinas interrumpibles)
+        if config['checkpoint'] and os.path.exists(config['checkpoint']):
+            engine.load_checkpoint(config['checkpoint'])
+            # Conservar el historial ya escrito hasta la iteración del checkpoint
+            if history is not None:
+                history.resume(engine.current_iteration)
+        start = time.perf_counter()
+        while engine.step():
+            pass
+        elapsed = time.perf_counter() - start
+    finally:
+        engine.close()
+        if history is not None:
+            history.close()
+    stats = engine.get_stats()
+    return {
+        'objective': config['objective'],
+        'dimensions': len(bounds),
+        'particles': int(config['particles']),
+        'iterations': stats['iteration'],
+        'seed': config['seed'],
+        'backend': config['backend'],
+        'topology': config['topology'],
+        'coefficients': config['coefficients'],
+        'boundary': config['boundary'],
+        'best_error': stats['best_error'],
+        'evaluations': stats['evaluations'],
+        'skipped_evaluations': stats.get('skipped_evaluations', 0),
+        'surrogate_skipped': stats.get('surrogate_skipped', 0),
+        'best_violation': stats.get('best_violation', 0.0),
+        'stop_reason': stats['stop_reason'],
+        'elapsed_s': elapsed,
+        'best_position': stats['best_position'],
+        'profile': stats.get('profile'),
+        'pareto_front': stats.get('pareto_front'),
+    }
+
+
+def run_path(path, index):
+    """Derivar el archivo propio de la ejecución `index` (p. ej. ck.npz -> ck_3.npz)"""
+    root, ext = os.path.splitext(path)
+    return f'{root}_{index}{ext}'
+
+
+def expand_config(config):
+    """Expandir la rejilla 'sweep' y las repeticiones en una lista de configuraciones
+
+    Con más de una ejecución, cada una recibe sus propios archivos de
+    checkpoint e historial (numerados según su posición en la expansión,
+    estable entre invocaciones).
+    """
+    base = {k: v for k, v in config.items() if k not in ('sweep', 'repeats')}
+    sweep = config.get('sweep', {})
+    repeats = int(config.get('repeats', 1))
+    runs = []
+    # Producto cartesiano de todos los valores del barrido
+    for values in itertools.product(*sweep.values()):
+        run = {**base, **dict(zip(sweep.keys(), values))}
+        for r in range(repeats):
+            # Semillas consecutivas para las repeticiones (si hay semilla base)
+            seed = run.get('seed')
+            runs.append({**run, 'seed': None if seed is None else seed + r})
+    if len(runs) > 1:
+        for index, run in enumerate(runs):
+            for key in ('checkpoint', 'history'):
+                if run.get(key):
+                    run[key] = run_path(run[key], index)
+    return runs
+
+
+def run_experiments(configs, workers=None):
+    """Ejecutar las configuraciones en un pool de procesos (en orden de entrada)"""
+    if workers == 1 or len(configs) == 1:
+        return [run_single(c) for c in configs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_single, configs))
+
+
+def write_results(results, path):
+    """Guardar resultados en CSV o JSON según la extensión del archivo"""
+    if path.endswith('.json'):
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2)
+        return
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0]))
+        writer.writeheader()
+        for row in results:
+            writer.writerow({**row, 'best_position': json.dumps(row['best_position']),
+                             'profile': json.dumps(row['profile']),
+                             'pareto_front': json.dumps(row['pareto_front'])})
+
+
+def main(argv=None):
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='PSO sin interfaz gráfica')
+    parser.add_argument('config', help='archivo de configuración JSON')
+    parser.add_argument('-o', '--output', help='archivo de resultados (.csv o .json)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='procesos para el barrido (por defecto, uno por núcleo)')
+    args = parser.parse_args(argv)
+
+    with open(args.config) as f:
+        config = json.load(f)
+    results = run_experiments(expand_config(config), workers=args.workers)
+
+    if args.output:
+        write_results(results, args.output)
+    for r in results:
+        # En modo multiobjetivo se informa el tamaño del frente en lugar del error
+        outcome = f"error={r['best_error']:.6g}" if r['pareto_front'] is None \
+            else f"frente={len(r['pareto_front'])} soluciones"
+        print(f"{r['objective']} D={r['dimensions']} N={r['particles']} seed={r['seed']}: "
+              f"{outcome} ({r['elapsed_s']:.3f} s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
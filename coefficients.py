@@ -0,0 +1,102 @@
+"""
+PSO - Coeficientes de la ecuación de velocidad y sus programaciones
+Archivo: coefficients.py
+
+Cada programación implementa reset(engine), llamado al inicializar el
+enjambre, y update(engine), llamado una vez por iteración tras evaluar
+(antes de mover las partículas). Ambas fijan engine.w, engine.c1 y
+engine.c2, que el motor usa en update_velocities.
+"""
+
+# Importar math para el factor de constricción
+import math
+
+
+class ConstantCoefficients:
+    """Coeficientes constantes (por defecto, los del código original)"""
+
+    def __init__(self, w=0.5, c1=1.0, c2=2.0):
+        self.w = w      # constant inertia weight
+        self.c1 = c1    # cognative constant
+        self.c2 = c2    # social constant
+
+    def reset(self, engine):
+        """Fijar los coeficientes iniciales en el motor"""
+        engine.w, engine.c1, engine.c2 = self.w, self.c1, self.c2
+
+    def update(self, engine):
+        """Actualizar los coeficientes tras la fase de evaluación de una iteración"""
+        pass
+
+
+class LinearInertia(ConstantCoefficients):
+    """Inercia linealmente decreciente de `w_start` a `w_end` a lo largo de la ejecución
+
+    Sin max_iterations (ejecución limitada sólo por criterios) se usa `horizon`
+    como número de iteraciones de referencia.
+    """
+
+    def __init__(self, w_start=0.9, w_end=0.4, c1=2.0, c2=2.0, horizon=1000):
+        super().__init__(w_start, c1, c2)
+        self.w_start = w_start
+        self.w_end = w_end
+        self.horizon = horizon
+
+    def update(self, engine):
+        total = engine.max_iterations if engine.max_iterations is not None else self.horizon
+        progress = min(1.0, engine.current_iteration / max(1, total - 1))
+        engine.w = self.w_start - (self.w_start - self.w_end) * progress
+
+
+class Constriction(ConstantCoefficients):
+    """Factor de constricción de Clerc y Kennedy
+
+    v = chi * (v + phi1·r1·(p - x) + phi2·r2·(g - x)), con phi = phi1 + phi2 > 4,
+    equivalente a w = chi, c1 = chi·phi1 y c2 = chi·phi2.
+    """
+
+    def __init__(self, phi1=2.05, phi2=2.05):
+        phi = phi1 + phi2
+        if phi <= 4:
+            raise ValueError(f'La constricción requiere phi1 + phi2 > 4 (recibido {phi:g})')
+        chi = 2.0 / abs(2.0 - phi - math.sqrt(phi * phi - 4.0 * phi))
+        super().__init__(chi, chi * phi1, chi * phi2)
+
+
+class AdaptiveInertia(ConstantCoefficients):
+    """Inercia adaptativa según la tasa de éxito del enjambre (AIWPSO)
+
+    La tasa de éxito es la fracción de partículas que mejoraron su mejor
+    personal en la iteración: w = w_min + (w_max - w_min) · éxito. Un enjambre
+    que sigue mejorando conserva inercia para explorar; uno estancado la
+    reduce para explotar.
+    """
+
+    def __init__(self, w_min=0.4, w_max=0.9, c1=2.0, c2=2.0):
+        super().__init__(w_max, c1, c2)
+        self.w_min = w_min
+        self.w_max = w_max
+
+    def update(self, engine):
+        engine.w = self.w_min + (self.w_max - self.w_min) * engine.success_rate
+
+
+# Programaciones disponibles por nombre
+COEFFICIENTS = {
+    'constant': ConstantCoefficients,
+    'linear_inertia': LinearInertia,
+    'constriction': Constriction,
+    'adaptive_inertia': AdaptiveInertia,
+}
+
+
+def make_coefficients(spec):
+    """Crear una programación desde su nombre o desde {nombre: {argumentos}}"""
+    if isinstance(spec, dict):
+        (name, options), = spec.items()
+    else:
+        name, options = spec, {}
+    if name not in COEFFICIENTS:
+        raise ValueError(f"Programación de coeficientes desconocida: {name!r} "
+                         f"(opciones: {', '.join(COEFFICIENTS)})")
+    return COEFFICIENTS[name](**options)
@@ -0,0 +1,2 @@
+# Presencia en la raíz: pytest agrega este directorio a sys.path y las
+# pruebas de tests/ importan los módulos planos (logic, criteria, ...)
@@ -0,0 +1,86 @@
+"""
+PSO - Manejo de restricciones de desigualdad g(x) <= 0
+Archivo: constraints.py
+
+Las restricciones son funciones baratas (escalares o batch, como la función
+de costo) que se evalúan ANTES del objetivo. Cada manejador implementa:
+    violation(constraints, positions) -> violación total (n,) >= 0
+    needs_objective(violations)       -> máscara de filas que requieren el objetivo
+    combine(errors, violations)       -> (errores, violaciones) para comparar
+El motor compara partículas de forma lexicográfica por (violación, error):
+una partícula factible siempre supera a una infactible, y entre infactibles
+gana la de menor violación.
+"""
+
+# Importar NumPy para las operaciones vectorizadas
+import numpy as np
+
+# Importar la evaluación por bloques (batch o escalar)
+from evaluators import evaluate_chunk
+
+
+class FeasibilityRules:
+    """Reglas de factibilidad de Deb
+
+    El objetivo sólo se evalúa en las partículas factibles; las infactibles
+    reciben error infinito y se ordenan por su violación total. Una
+    restricción se considera cumplida si g(x) <= tolerance.
+    """
+
+    def __init__(self, tolerance=0.0):
+        self.tolerance = tolerance
+
+    def violation(self, constraints, positions):
+        """Sumar la violación max(0, g(x) - tolerance) de cada restricción"""
+        total = np.zeros(len(positions))
+        for constraint in constraints:
+            total += np.maximum(0.0, evaluate_chunk(constraint, positions) - self.tolerance)
+        return total
+
+    def needs_objective(self, violations):
+        """Evaluar el objetivo sólo en las filas factibles"""
+        return violations == 0
+
+    def combine(self, errors, violations):
+        """Las filas sin objetivo ya tienen error infinito: comparar por (violación, error)"""
+        return errors, violations
+
+
+class Penalty(FeasibilityRules):
+    """Penalización estática: error = f(x) + coefficient · violación^exponent
+
+    Requiere evaluar el objetivo también en las partículas infactibles, por
+    lo que no ahorra llamadas; útil cuando la región factible es muy estrecha
+    y conviene que el enjambre la atraviese.
+    """
+
+    def __init__(self, coefficient=1e3, exponent=2.0, tolerance=0.0):
+        super().__init__(tolerance)
+        self.coefficient = coefficient
+        self.exponent = exponent
+
+    def needs_objective(self, violations):
+        return np.ones(len(violations), dtype=bool)
+
+    def combine(self, errors, violations):
+        # La penalización ya ordena las partículas: la violación no se compara aparte
+        return errors + self.coefficient * violations ** self.exponent, np.zeros_like(violations)
+
+
+# Manejadores disponibles por nombre
+CONSTRAINT_HANDLERS = {
+    'feasibility': FeasibilityRules,
+    'penalty': Penalty,
+}
+
+
+def make_constraint_handling(spec):
+    """Crear un manejador desde su nombre o desde {nombre: {argumentos}}"""
+    if isinstance(spec, dict):
+        (name, options), = spec.items()
+    else:
+        name, options = spec, {}
+    if name not in CONSTRAINT_HANDLERS:
+        raise ValueError(f"Manejo de restricciones desconocido: {name!r} "
+                         f"(opciones: {', '.join(CONSTRAINT_HANDLERS)})")
+    return CONSTRAINT_HANDLERS[name](**options)
@@ -0,0 +1,166 @@
+"""
+PSO - Criterios de terminación del motor
+Archivo: criteria.py
+
+Cada criterio implementa reset(engine), llamado al inicializar el enjambre,
+y check(engine), llamado al final de cada iteración. check retorna None
+para continuar o un texto con el motivo de parada, que el motor reporta
+en get_stats()['stop_reason']. Los criterios con estado interno lo exponen
+con checkpoint_state() (diccionario serializable a JSON) y lo recuperan con
+restore_checkpoint_state(state) al reanudar desde un checkpoint.
+"""
+
+# Importar time para el presupuesto de tiempo de reloj
+import time
+# Importar NumPy para las medidas sobre el enjambre
+import numpy as np
+
+
+class TerminationCriterion:
+    """Criterio base - Nunca detiene la optimización"""
+
+    def reset(self, engine):
+        """Reiniciar el estado interno al inicializar el enjambre"""
+        pass
+
+    def check(self, engine):
+        """Retornar el motivo de parada o None para continuar"""
+        return None
+
+    def checkpoint_state(self):
+        """Estado interno que guarda el checkpoint (ninguno por defecto)"""
+        return {}
+
+    def restore_checkpoint_state(self, state):
+        """Restaurar el estado de checkpoint_state (llamado después de reset)"""
+        pass
+
+
+class TargetError(TerminationCriterion):
+    """Detener cuando el mejor error global alcanza el objetivo"""
+
+    def __init__(self, target):
+        self.target = target
+
+    def check(self, engine):
+        if engine.err_best_g <= self.target:
+            return f'target_error: {engine.err_best_g:.6g} <= {self.target:.6g}'
+        return None
+
+
+class Stagnation(TerminationCriterion):
+    """Detener si err_best_g no mejora más que `tolerance` durante `iterations` iteraciones"""
+
+    def __init__(self, iterations, tolerance=0.0):
+        self.iterations = iterations
+        self.tolerance = tolerance
+
+    def reset(self, engine):
+        # Último mejor error que contó como mejora y la iteración en que ocurrió
+        self._best = np.inf
+        self._since = 0
+
+    def check(self, engine):
+        if engine.err_best_g < self._best - self.tolerance:
+            self._best = engine.err_best_g
+            self._since = engine.current_iteration
+        elif engine.current_iteration - self._since >= self.iterations:
+            return f'stagnation: sin mejora en {self.iterations} iteraciones'
+        return None
+
+    def checkpoint_state(self):
+        return {'best': self._best, 'since': self._since}
+
+    def restore_checkpoint_state(self, state):
+        self._best = state['best']
+        self._since = state['since']
+
+
+class SwarmDiameter(TerminationCriterion):
+    """Detener cuando la diagonal de la caja que contiene al enjambre cae bajo el umbral
+
+    Se usa la diagonal del bounding box (O(N·D)) como cota superior del
+    diámetro del enjambre, en lugar de la distancia máxima entre pares (O(N²·D)).
+    """
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+
+    def check(self, engine):
+        extent = engine.positions.max(axis=0) - engine.positions.min(axis=0)
+        diameter = float(np.linalg.norm(extent))
+        if diameter < self.threshold:
+            return f'swarm_diameter: {diameter:.6g} < {self.threshold:.6g}'
+        return None
+
+
+class VelocityNorm(TerminationCriterion):
+    """Detener cuando la mayor norma de velocidad del enjambre cae bajo el umbral"""
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+
+    def check(self, engine):
+        norm = float(np.sqrt(np.einsum('ij,ij->i', engine.velocities, engine.velocities).max()))
+        if norm < self.threshold:
+            return f'velocity_norm: {norm:.6g} < {self.threshold:.6g}'
+        return None
+
+
+class TimeBudget(TerminationCriterion):
+    """Detener al agotar un presupuesto de tiempo de reloj (segundos)"""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def reset(self, engine):
+        self._start = time.perf_counter()
+
+    def check(self, engine):
+        if time.perf_counter() - self._start >= self.seconds:
+            return f'time_budget: {self.seconds:g} s'
+        return None
+
+    def checkpoint_state(self):
+        # Guardar el tiempo consumido: el reloj sigue contando desde ahí al reanudar
+        return {'elapsed': time.perf_counter() - self._start}
+
+    def restore_checkpoint_state(self, state):
+        self._start = time.perf_counter() - state['elapsed']
+
+
+class EvaluationBudget(TerminationCriterion):
+    """Detener al agotar un presupuesto de evaluaciones de la función de costo"""
+
+    def __init__(self, max_evaluations):
+        self.max_evaluations = max_evaluations
+
+    def check(self, engine):
+        if engine.num_evaluations >= self.max_evaluations:
+            return f'evaluation_budget: {engine.num_evaluations} >= {self.max_evaluations}'
+        return None
+
+
+# Criterios disponibles por nombre (para archivos de configuración)
+CRITERIA = {
+    'target_error': TargetError,
+    'stagnation': Stagnation,
+    'swarm_diameter': SwarmDiameter,
+    'velocity_norm': VelocityNorm,
+    'time_budget': TimeBudget,
+    'evaluation_budget': EvaluationBudget,
+}
+
+
+def make_criteria(config):
+    """Crear criterios desde un diccionario {nombre: valor o {argumentos}}"""
+    criteria = []
+    for name, value in config.items():
+        if name not in CRITERIA:
+            raise ValueError(f"Criterio de terminación desconocido: {name!r} "
+                             f"(opciones: {', '.join(CRITERIA)})")
+        if isinstance(value, dict):
+            criteria.append(CRITERIA[name](**value))
+        else:
+            criteria.append(CRITERIA[name](value))
+    return criteria
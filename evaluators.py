@@ -0,0 +1,209 @@
+"""
+PSO - Evaluadores de fitness (serial, hilos y procesos)
+Archivo: evaluators.py
+
+Cada evaluador recibe la matriz de posiciones (N, D) y retorna un vector
+con N errores en el mismo orden de las filas, sin importar qué trabajador
+termine primero. Así la reducción del mejor global es determinista. Las
+funciones multiobjetivo retornan en su lugar una matriz (N, M).
+
+evaluate_timed() retorna además la latencia de cada llamada a la función de
+costo, medida donde se ejecuta (en el hilo o proceso trabajador).
+"""
+
+# Importar utilidades de concurrencia de la biblioteca estándar
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+# Importar os para conocer el número de núcleos disponibles
+import os
+# Importar time para medir la latencia de cada llamada
+import time
+# Importar NumPy para manejar la matriz de posiciones
+import numpy as np
+
+
+#--- EVALUACIÓN DE BLOQUES ----------------------------------------------------+
+def is_batch_cost_function(func):
+    """Indicar si la función de costo implementa el protocolo batch (ver logic.batch_cost_function)"""
+    return bool(getattr(func, 'is_batch', False))
+
+
+def evaluate_chunk(cost_function, positions):
+    """Evaluar un bloque (n, D) de posiciones - batch si es posible, escalar si no"""
+    # Forma batch: una sola llamada con el bloque completo
+    if is_batch_cost_function(cost_function):
+        errors = np.asarray(cost_function(positions), dtype=float)
+        # Un error por fila (N,) o, si es multiobjetivo, un vector por fila (N, M)
+        if errors.size == len(positions):
+            return errors.reshape(len(positions))
+        return errors.reshape(len(positions), -1)
+    # Forma escalar: una llamada por partícula
+    return np.array([cost_function(x) for x in positions], dtype=float)
+
+
+def timed_evaluate_chunk(cost_function, positions):
+    """Evaluar un bloque como evaluate_chunk midiendo cada llamada a la función de costo
+
+    Retorna (errores, llamadas) con llamadas = [(puntos, segundos), ...]: una
+    sola llamada con todo el bloque en forma batch, una por fila en forma escalar.
+    """
+    if is_batch_cost_function(cost_function):
+        start = time.perf_counter()
+        errors = evaluate_chunk(cost_function, positions)
+        return errors, [(len(positions), time.perf_counter() - start)]
+    errors = []
+    calls = []
+    for x in positions:
+        start = time.perf_counter()
+        errors.append(cost_function(x))
+        calls.append((1, time.perf_counter() - start))
+    return np.array(errors, dtype=float), calls
+
+
+# Función de costo del proceso trabajador (se fija una sola vez al crear el pool)
+_worker_cost_function = None
+
+
+def _init_worker(cost_function):
+    """Inicializador de cada proceso del pool - guarda la función de costo"""
+    global _worker_cost_function
+    _worker_cost_function = cost_function
+
+
+def _evaluate_chunk_in_worker(positions):
+    """Evaluar un bloque dentro de un proceso trabajador"""
+    return evaluate_chunk(_worker_cost_function, positions)
+
+
+def _timed_evaluate_chunk_in_worker(positions):
+    """Evaluar y medir un bloque dentro de un proceso trabajador"""
+    return timed_evaluate_chunk(_worker_cost_function, positions)
+
+
+#--- EVALUADORES --------------------------------------------------------------+
+class SerialEvaluator:
+    """Evaluador serial - Evalúa el enjambre en el hilo actual"""
+
+    def __init__(self, cost_function):
+        # Función objetivo a evaluar
+        self.cost_function = cost_function
+
+    def evaluate(self, positions):
+        """Evaluar la matriz de posiciones y retornar el vector de errores"""
+        return evaluate_chunk(self.cost_function, positions)
+
+    def evaluate_timed(self, positions):
+        """Evaluar y retornar (errores, [(puntos, segundos) por llamada a la función de costo])"""
+        return timed_evaluate_chunk(self.cost_function, positions)
+
+    def close(self):
+        """Liberar recursos (nada que liberar en modo serial)"""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _PoolEvaluator(SerialEvaluator):
+    """Base de los evaluadores con pool - El pool sobrevive entre iteraciones"""
+
+    def __init__(self, cost_function, max_workers=None, chunk_size=None):
+        super().__init__(cost_function)
+        # Número de trabajadores del pool (por defecto, un trabajador por núcleo)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Filas por tarea (None calcula un tamaño a partir de N y los trabajadores)
+        self.chunk_size = chunk_size
+        # Pool creado de forma perezosa en la primera evaluación
+        self._executor = None
+
+    def _create_executor(self):
+        """Crear el pool de trabajadores concreto"""
+        raise NotImplementedError
+
+    def _submit(self, chunk, timed=False):
+        """Enviar un bloque al pool y retornar su future (con `timed`, el de la versión medida)"""
+        raise NotImplementedError
+
+    def _chunk_bounds(self, n):
+        """Calcular los índices (inicio, fin) de cada bloque"""
+        # Por defecto, unas 4 tareas por trabajador para balancear la carga
+        size = self.chunk_size or max(1, -(-n // (self.max_workers * 4)))
+        return [(start, min(start + size, n)) for start in range(0, n, size)]
+
+    def evaluate(self, positions):
+        """Evaluar la matriz de posiciones repartiendo bloques en el pool"""
+        futures = self._submit_all(positions, timed=False)
+        if not futures:
+            return np.empty(0)
+        # Concatenar en orden (vectores (n,) o, si es multiobjetivo, matrices (n, M))
+        return np.concatenate([future.result() for future in futures])
+
+    def evaluate_timed(self, positions):
+        """Evaluar en el pool y reunir las latencias medidas en cada trabajador"""
+        futures = self._submit_all(positions, timed=True)
+        if not futures:
+            return np.empty(0), []
+        results = [future.result() for future in futures]
+        return (np.concatenate([errors for errors, _ in results]),
+                [call for _, calls in results for call in calls])
+
+    def _submit_all(self, positions, timed):
+        """Enviar todos los bloques al pool (futures en el orden de las filas)"""
+        # Crear el pool una sola vez y reutilizarlo en las siguientes iteraciones
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return [self._submit(positions[start:end], timed)
+                for start, end in self._chunk_bounds(len(positions))]
+
+    def close(self):
+        """Cerrar el pool de trabajadores"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class ThreadPoolEvaluator(_PoolEvaluator):
+    """Evaluador con hilos - Útil si la función de costo libera el GIL (E/S, NumPy, simuladores externos)"""
+
+    def _create_executor(self):
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _submit(self, chunk, timed=False):
+        function = timed_evaluate_chunk if timed else evaluate_chunk
+        return self._executor.submit(function, self.cost_function, chunk)
+
+
+class ProcessPoolEvaluator(_PoolEvaluator):
+    """Evaluador con procesos - La función de costo debe poder serializarse (pickle)"""
+
+    def _create_executor(self):
+        # La función de costo se envía una sola vez a cada proceso
+        return ProcessPoolExecutor(max_workers=self.max_workers,
+                                   initializer=_init_worker,
+                                   initargs=(self.cost_function,))
+
+    def _submit(self, chunk, timed=False):
+        function = _timed_evaluate_chunk_in_worker if timed else _evaluate_chunk_in_worker
+        return self._executor.submit(function, chunk)
+
+
+# Evaluadores disponibles por nombre
+EVALUATORS = {
+    'serial': SerialEvaluator,
+    'thread': ThreadPoolEvaluator,
+    'process': ProcessPoolEvaluator,
+}
+
+
+def make_evaluator(backend, cost_function, **options):
+    """Crear un evaluador a partir de su nombre ('serial', 'thread' o 'process')"""
+    # Validar que el backend exista
+    if backend not in EVALUATORS:
+        raise ValueError(f"Backend de evaluación desconocido: {backend!r} "
+                         f"(opciones: {', '.join(EVALUATORS)})")
+    # El evaluador serial no acepta opciones de pool
+    if backend == 'serial':
+        return SerialEvaluator(cost_function)
+    return EVALUATORS[backend](cost_function, **options)
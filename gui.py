@@ -7,19 +7,148 @@ pip install PyQt5 matplotlib numpy
 """
 
 import sys
+import threading
+import time
+from collections import namedtuple
 import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QSpinBox, QDoubleSpinBox,
                              QPushButton, QSlider, QGroupBox, QGridLayout,
-                             QMessageBox)
-from PyQt5.QtCore import QTimer, Qt
+                             QMessageBox, QComboBox, QCheckBox)
+from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
 # Importar la lógica del PSO
-from logic import PSOEngine, func1
+from logic import PSOEngine, BENCHMARK_FUNCTIONS
+from projection import AxisProjection, PCAProjection, evaluate_slice
+from profiling import Profiler, NULL_PROFILER, format_profile
+
+# Máximo de partículas para dibujar líneas hacia la mejor personal
+MAX_BEST_LINES = 500
+# Intervalo de refresco de la interfaz (ms), independiente de la velocidad del motor
+FRAME_INTERVAL_MS = 33
+# Límites del espacio de búsqueda en cada dimensión
+BOUND = (-10, 10)
+# Intervalo mínimo (s) entre recálculos del paisaje y resolución de su rejilla
+LANDSCAPE_REFRESH_S = 1.0
+LANDSCAPE_RESOLUTION = 60
+# Coordenada del óptimo conocido de cada función de prueba (igual en todas las dimensiones)
+KNOWN_OPTIMA = {'sphere': 0.0, 'rastrigin': 0.0, 'rosenbrock': 1.0, 'ackley': 0.0, 'griewank': 0.0}
+
+# Copia proyectada (2D) del estado del enjambre publicada por el hilo del motor
+Snapshot = namedtuple('Snapshot', ['positions', 'best_positions', 'has_best', 'global_best',
+                                   'stats', 'landscape'])
+# Paisaje de la función de costo sobre el plano proyectado (None si no cambió)
+Landscape = namedtuple('Landscape', ['U', 'V', 'Z', 'extent', 'labels', 'optimum'])
+
+
+class PSOWorker(QThread):
+    """Hilo que ejecuta el motor PSO y publica sólo la última instantánea"""
+    
+    # Señal emitida (en el hilo de la interfaz) al terminar la optimización
+    optimization_finished = pyqtSignal()
+    
+    def __init__(self, pso_engine, projection):
+        super().__init__()
+        self.pso_engine = pso_engine
+        # Proyección 2D usada para publicar el enjambre y evaluar el paisaje
+        self.projection = projection
+        # Coordenada del óptimo conocido (None si se desconoce)
+        self.optimum = None
+        # Instante del último paisaje y mejor global con el que se calculó
+        self._landscape_time = -np.inf
+        self._landscape_anchor = None
+        # Pausa mínima entre iteraciones (ms); 0 = máxima velocidad
+        self.delay_ms = 0
+        self._running = False
+        # Última instantánea publicada y su número de versión
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._version = 0
+        # Última versión entregada a la interfaz
+        self._taken_version = 0
+    
+    def run(self):
+        """Ciclo del motor: paso, publicación y pausa opcional"""
+        self._running = True
+        while self._running:
+            started = time.perf_counter()
+            continue_running = self.pso_engine.step()
+            self.publish()
+            if not continue_running:
+                self._running = False
+                self.optimization_finished.emit()
+                break
+            # Respetar la pausa configurada descontando el tiempo del paso
+            remaining = self.delay_ms / 1000 - (time.perf_counter() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+    
+    def stop(self):
+        """Detener el ciclo y esperar a que el hilo termine"""
+        self._running = False
+        self.wait()
+    
+    def publish(self, force_landscape=False):
+        """Proyectar el estado del motor y publicarlo como la instantánea más reciente"""
+        record = self.pso_engine.make_record()
+        projection = self.projection
+        projection_changed = projection.update(record.positions)
+        global_best = record.best_position
+        snapshot = Snapshot(
+            positions=projection.project(record.positions),
+            best_positions=projection.project(record.best_positions),
+            has_best=np.isfinite(self.pso_engine.err_best),
+            global_best=projection.project(global_best) if global_best.size else global_best.copy(),
+            stats=self.pso_engine.get_stats(),
+            landscape=self.compute_landscape(force_landscape, projection_changed),
+        )
+        with self._lock:
+            # Conservar un paisaje aún no renderizado de la instantánea descartada
+            if (snapshot.landscape is None and self._snapshot is not None
+                    and self._taken_version != self._version):
+                snapshot = snapshot._replace(landscape=self._snapshot.landscape)
+            # Reemplazar la anterior: las instantáneas no renderizadas se descartan
+            self._snapshot = snapshot
+            self._version += 1
+    
+    def compute_landscape(self, force, projection_changed):
+        """Evaluar de forma perezosa el paisaje en el corte proyectado que pasa por pos_best_g
+        
+        Sólo se recalcula si cambió la proyección o (con D > 2) el mejor global,
+        y como máximo una vez cada LANDSCAPE_REFRESH_S segundos.
+        """
+        engine = self.pso_engine
+        anchor = engine.pos_best_g if engine.pos_best_g.size else engine.positions.mean(axis=0)
+        # Con D = 2 el corte es todo el espacio: no depende del ancla
+        anchor_changed = (engine.num_dimensions > 2 and
+                          not np.array_equal(anchor, self._landscape_anchor))
+        if not force:
+            if not (projection_changed or anchor_changed):
+                return None
+            if time.perf_counter() - self._landscape_time < LANDSCAPE_REFRESH_S:
+                return None
+        self._landscape_time = time.perf_counter()
+        self._landscape_anchor = anchor.copy()
+        
+        extent = self.projection.box_extent(engine.lower_bounds, engine.upper_bounds)
+        U, V, Z = evaluate_slice(engine.cost_function, self.projection, anchor, extent,
+                                 engine.lower_bounds, engine.upper_bounds, LANDSCAPE_RESOLUTION)
+        optimum = None
+        if self.optimum is not None:
+            optimum = self.projection.project(np.full(engine.num_dimensions, self.optimum))
+        return Landscape(U, V, Z, extent, self.projection.labels, optimum)
+    
+    def latest(self, seen_version):
+        """Retornar (versión, instantánea) si hay una más nueva que `seen_version`"""
+        with self._lock:
+            if self._version == seen_version:
+                return seen_version, None
+            self._taken_version = self._version
+            return self._version, self._snapshot
 
 
 class PSOVisualizerWindow(QMainWindow):
@@ -27,10 +156,19 @@ class PSOVisualizerWindow(QMainWindow):
     
     def __init__(self):
         super().__init__()
-        self.pso_engine = PSOEngine(cost_function=func1)
+        self.pso_engine = PSOEngine(cost_function=BENCHMARK_FUNCTIONS['sphere'])
+        # Función objetivo y dimensiones con las que se creó el motor
+        self.engine_key = ('sphere', 2)
         self.is_running = False
+        # Hilo del motor y versión de la última instantánea renderizada
+        self.worker = PSOWorker(self.pso_engine, AxisProjection(2))
+        self.worker.optimization_finished.connect(self.on_optimization_finished)
+        self.rendered_version = 0
+        # Tiempos de renderizado, aparte del perfil del motor (no suman a sus fases)
+        self.render_profiler = NULL_PROFILER
+        # Temporizador de refresco: renderiza la última instantánea a su propio ritmo
         self.timer = QTimer()
-        self.timer.timeout.connect(self.step_pso)
+        self.timer.timeout.connect(self.render_latest)
         
         self.init_ui()
         self.reset_pso()
@@ -83,7 +221,7 @@ class PSOVisualizerWindow(QMainWindow):
         # Número de partículas
         params_layout.addWidget(QLabel('Número de Partículas:'), 0, 0)
         self.num_particles_spin = QSpinBox()
-        self.num_particles_spin.setRange(5, 50)
+        self.num_particles_spin.setRange(5, 10000)
         self.num_particles_spin.setValue(15)
         params_layout.addWidget(self.num_particles_spin, 0, 1)
         
@@ -110,15 +248,53 @@ class PSOVisualizerWindow(QMainWindow):
         self.init_y_spin.setValue(5.0)
         params_layout.addWidget(self.init_y_spin, 3, 1)
         
+        # Función objetivo
+        params_layout.addWidget(QLabel('Función Objetivo:'), 4, 0)
+        self.objective_combo = QComboBox()
+        self.objective_combo.addItems(list(BENCHMARK_FUNCTIONS))
+        params_layout.addWidget(self.objective_combo, 4, 1)
+        
+        # Dimensiones (con D > 2 la posición inicial X, Y se repite)
+        params_layout.addWidget(QLabel('Dimensiones:'), 5, 0)
+        self.dimensions_spin = QSpinBox()
+        self.dimensions_spin.setRange(2, 500)
+        self.dimensions_spin.setValue(2)
+        self.dimensions_spin.valueChanged.connect(self.update_axis_ranges)
+        params_layout.addWidget(self.dimensions_spin, 5, 1)
+        
         layout.addWidget(params_group)
         
+        # Proyección para visualizar D > 2
+        projection_group = QGroupBox('Proyección')
+        projection_layout = QGridLayout()
+        projection_group.setLayout(projection_layout)
+        
+        projection_layout.addWidget(QLabel('Tipo:'), 0, 0)
+        self.projection_combo = QComboBox()
+        self.projection_combo.addItems(['Ejes', 'PCA'])
+        projection_layout.addWidget(self.projection_combo, 0, 1)
+        
+        projection_layout.addWidget(QLabel('Eje horizontal:'), 1, 0)
+        self.axis_x_spin = QSpinBox()
+        self.axis_x_spin.setRange(0, 1)
+        self.axis_x_spin.setValue(0)
+        projection_layout.addWidget(self.axis_x_spin, 1, 1)
+        
+        projection_layout.addWidget(QLabel('Eje vertical:'), 2, 0)
+        self.axis_y_spin = QSpinBox()
+        self.axis_y_spin.setRange(0, 1)
+        self.axis_y_spin.setValue(1)
+        projection_layout.addWidget(self.axis_y_spin, 2, 1)
+        
+        layout.addWidget(projection_group)
+        
         # Velocidad de animación
-        speed_group = QGroupBox('Velocidad de Animación')
+        speed_group = QGroupBox('Pausa por Iteración')
         speed_layout = QVBoxLayout()
         speed_group.setLayout(speed_layout)
         
         self.speed_slider = QSlider(Qt.Horizontal)
-        self.speed_slider.setRange(50, 500)
+        self.speed_slider.setRange(0, 500)
         self.speed_slider.setValue(100)
         self.speed_slider.setTickPosition(QSlider.TicksBelow)
         self.speed_slider.setTickInterval(50)
@@ -131,6 +307,11 @@ class PSOVisualizerWindow(QMainWindow):
         
         layout.addWidget(speed_group)
         
+        # Perfilado: tiempos por fase superpuestos al gráfico
+        self.profile_check = QCheckBox('Mostrar perfilado por fase')
+        self.profile_check.stateChanged.connect(self.apply_profiling)
+        layout.addWidget(self.profile_check)
+        
         # Botones
         button_layout = QHBoxLayout()
         
@@ -196,6 +377,9 @@ class PSOVisualizerWindow(QMainWindow):
         self.canvas = FigureCanvas(self.figure)
         self.ax = self.figure.add_subplot(111)
         layout.addWidget(self.canvas)
+        # Capturar el fondo tras cada redibujado completo (p. ej. al redimensionar)
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
+        self.init_plot()
         
         # Leyenda
         legend_layout = QHBoxLayout()
@@ -205,7 +389,7 @@ class PSOVisualizerWindow(QMainWindow):
             ('🔵', 'Partículas', '#3498db'),
             ('🔴', 'Mejor Global', '#e74c3c'),
             ('🟢', 'Mejor Personal', '#2ecc71'),
-            ('⭐', 'Óptimo (0,0)', '#f39c12')
+            ('⭐', 'Óptimo', '#f39c12')
         ]
         
         for emoji, text, color in legend_items:
@@ -268,69 +452,141 @@ class PSOVisualizerWindow(QMainWindow):
             }
         """)
     
+    def apply_profiling(self):
+        """Activar o desactivar la instrumentación del motor según la casilla"""
+        enabled = self.profile_check.isChecked()
+        self.pso_engine.profiler = Profiler() if enabled else NULL_PROFILER
+        self.render_profiler = Profiler() if enabled else NULL_PROFILER
+        # Refrescar la superposición si el motor está detenido (si no, lo hará el hilo)
+        if not self.is_running:
+            self.worker.publish()
+            self.render_latest()
+    
     def update_speed_label(self):
         """Actualizar etiqueta de velocidad"""
         self.speed_label.setText(f'{self.speed_slider.value()} ms')
+        self.worker.delay_ms = self.speed_slider.value()
+    
+    def update_axis_ranges(self):
+        """Ajustar el rango de los ejes proyectables a las dimensiones elegidas"""
+        max_axis = self.dimensions_spin.value() - 1
+        self.axis_x_spin.setRange(0, max_axis)
+        self.axis_y_spin.setRange(0, max_axis)
     
     def init_plot(self):
-        """Inicializar visualización del gráfico"""
+        """Crear los artistas animados (el paisaje se dibuja en draw_landscape)"""
         self.ax.clear()
-        self.ax.set_xlim(-10, 10)
-        self.ax.set_ylim(-10, 10)
-        self.ax.set_xlabel('X', fontsize=12, fontweight='bold')
-        self.ax.set_ylabel('Y', fontsize=12, fontweight='bold')
         self.ax.grid(True, alpha=0.3)
-        
-        # Dibujar contorno de la función
-        x = np.linspace(-10, 10, 100)
-        y = np.linspace(-10, 10, 100)
-        X, Y = np.meshgrid(x, y)
-        Z = X**2 + Y**2
-        
-        self.ax.contourf(X, Y, Z, levels=20, cmap='Blues', alpha=0.4)
-        self.ax.contour(X, Y, Z, levels=20, colors='black', alpha=0.2, linewidths=0.5)
-        
-        # Marcar el óptimo
-        self.ax.plot(0, 0, 'r*', markersize=20, label='Óptimo (0,0)', zorder=5)
-        
-    def update_plot(self):
-        """Actualizar visualización con las partículas"""
-        self.init_plot()
-        
-        # Obtener posiciones de las partículas
-        positions = self.pso_engine.get_particles_positions()
-        best_positions = self.pso_engine.get_particles_best_positions()
-        global_best = self.pso_engine.get_global_best()
-        
-        # Dibujar partículas y sus mejores posiciones
-        for i, (pos, best_pos) in enumerate(zip(positions, best_positions)):
-            x, y = pos
-            
-            # Línea hacia mejor posición personal
-            if best_pos is not None:
-                best_x, best_y = best_pos
-                self.ax.plot([x, best_x], [y, best_y], 'g--', alpha=0.3, linewidth=1)
-            
-            # Partícula
-            self.ax.plot(x, y, 'bo', markersize=8, markeredgecolor='darkblue', 
-                        markeredgewidth=1.5, zorder=3)
-        
+        # Artistas del fondo estático: contornos del paisaje y óptimo
+        self.landscape_artists = []
+        self.optimum_marker, = self.ax.plot([], [], 'r*', markersize=20, label='Óptimo', zorder=5)
+        
+        # Artistas animados: se excluyen del fondo y se redibujan con blitting
+        # Líneas hacia la mejor posición personal: un solo Line2D con segmentos
+        # separados por NaN (mucho más rápido que una LineCollection de N paths)
+        self.best_lines, = self.ax.plot([], [], 'g--', alpha=0.3, linewidth=1, animated=True)
+        # En enjambres grandes las líneas dominan el tiempo de rasterizado: se
+        # muestran las mejores personales como puntos en su lugar
+        self.best_points = self.ax.scatter([], [], s=4, c='g', alpha=0.5, zorder=2, animated=True)
+        # Partículas (un solo scatter)
+        self.particles_scatter = self.ax.scatter([], [], s=64, c='b', edgecolors='darkblue',
+                                                 linewidths=1.5, zorder=3, animated=True)
         # Mejor posición global
-        if global_best:
-            self.ax.plot(global_best[0], global_best[1], 'ro', markersize=15, 
-                        label='Mejor Global', markeredgecolor='darkred', 
-                        markeredgewidth=2, zorder=4)
-        
+        self.global_best_marker, = self.ax.plot([], [], 'ro', markersize=15, label='Mejor Global',
+                                                markeredgecolor='darkred', markeredgewidth=2,
+                                                zorder=4, animated=True)
+        # Superposición con los tiempos por fase (vacía si el perfilado está desactivado)
+        self.profile_text = self.ax.text(0.01, 0.01, '', transform=self.ax.transAxes,
+                                         fontsize=8, family='monospace', va='bottom', zorder=6,
+                                         bbox=dict(boxstyle='round', fc='white', alpha=0.8),
+                                         animated=True)
         self.ax.legend(loc='upper right')
+        
+        self.background = None
         self.canvas.draw()
     
-    def update_stats(self):
-        """Actualizar estadísticas en la interfaz"""
-        stats = self.pso_engine.get_stats()
+    def draw_landscape(self, landscape):
+        """Redibujar el fondo estático con un nuevo paisaje (recaptura el fondo)"""
+        for artist in self.landscape_artists:
+            artist.remove()
+        U, V, Z = landscape.U, landscape.V, landscape.Z
+        self.landscape_artists = [
+            self.ax.contourf(U, V, Z, levels=20, cmap='Blues', alpha=0.4),
+            self.ax.contour(U, V, Z, levels=20, colors='black', alpha=0.2, linewidths=0.5),
+        ]
+        self.ax.set_xlim(*landscape.extent[0])
+        self.ax.set_ylim(*landscape.extent[1])
+        self.ax.set_xlabel(landscape.labels[0], fontsize=12, fontweight='bold')
+        self.ax.set_ylabel(landscape.labels[1], fontsize=12, fontweight='bold')
+        # Marcar el óptimo (si se conoce)
+        if landscape.optimum is not None:
+            self.optimum_marker.set_data([landscape.optimum[0]], [landscape.optimum[1]])
+        else:
+            self.optimum_marker.set_data([], [])
+        # El redibujado completo dispara on_canvas_draw, que guarda el nuevo fondo
+        self.canvas.draw()
+    
+    def on_canvas_draw(self, event):
+        """Guardar el fondo estático y volver a pintar los artistas animados"""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_animated()
+    
+    def draw_animated(self):
+        """Dibujar los artistas animados sobre el renderizador actual"""
+        self.ax.draw_artist(self.best_lines)
+        self.ax.draw_artist(self.best_points)
+        self.ax.draw_artist(self.particles_scatter)
+        self.ax.draw_artist(self.global_best_marker)
+        if self.profile_text.get_text():
+            self.ax.draw_artist(self.profile_text)
+    
+    def update_plot(self, snapshot):
+        """Actualizar visualización con las partículas (blitting sobre el fondo cacheado)"""
+        positions = snapshot.positions
+        has_best = snapshot.has_best
+        
+        # Partículas y líneas hacia su mejor posición personal
+        self.particles_scatter.set_offsets(positions)
+        best_positions = snapshot.best_positions[has_best]
+        if len(positions) <= MAX_BEST_LINES:
+            segments = np.full((len(best_positions), 3, 2), np.nan)
+            segments[:, 0] = positions[has_best]
+            segments[:, 1] = best_positions
+            self.best_lines.set_data(segments[:, :, 0].ravel(), segments[:, :, 1].ravel())
+            self.best_points.set_offsets(np.empty((0, 2)))
+        else:
+            self.best_lines.set_data([], [])
+            self.best_points.set_offsets(best_positions)
         
+        # Mejor posición global
+        if snapshot.global_best.size:
+            self.global_best_marker.set_data([snapshot.global_best[0]], [snapshot.global_best[1]])
+        else:
+            self.global_best_marker.set_data([], [])
+        
+        # Tiempos por fase del motor y, en una línea aparte, los de este mismo método
+        profile = snapshot.stats.get('profile')
+        text = format_profile(profile) if profile else ''
+        render = self.render_profiler.get_stats()['phases'].get('update_plot') \
+            if self.render_profiler.enabled else None
+        if render is not None:
+            text += f"\n{'render (GUI)':<14}{render['mean_ms']:8.3f} ms"
+        self.profile_text.set_text(text)
+        
+        # Restaurar el fondo, pintar sólo los artistas animados y copiar a pantalla
+        if self.background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self.draw_animated()
+        self.canvas.blit(self.ax.bbox)
+        self.canvas.flush_events()
+    
+    def update_stats(self, stats):
+        """Actualizar estadísticas en la interfaz"""
         self.iter_label.setText(str(stats['iteration']))
         
-        if stats['best_error'] != -1:
+        if np.isfinite(stats['best_error']):
             self.error_label.setText(f"{stats['best_error']:.6f}")
         else:
             self.error_label.setText('-')
@@ -346,16 +602,41 @@ class PSOVisualizerWindow(QMainWindow):
         """Reiniciar PSO"""
         self.is_running = False
         self.timer.stop()
+        # Detener el hilo del motor antes de reinicializar el enjambre
+        self.worker.stop()
         
         initial_x = self.init_x_spin.value()
         initial_y = self.init_y_spin.value()
         num_particles = self.num_particles_spin.value()
         max_iter = self.max_iter_spin.value()
+        objective = self.objective_combo.currentText()
+        dimensions = self.dimensions_spin.value()
+        
+        # Recrear el motor si cambió la función objetivo o las dimensiones
+        if (objective, dimensions) != self.engine_key:
+            self.pso_engine.close()
+            self.pso_engine = PSOEngine(cost_function=BENCHMARK_FUNCTIONS[objective],
+                                        bounds=[BOUND] * dimensions)
+            self.engine_key = (objective, dimensions)
+            self.worker.pso_engine = self.pso_engine
+            self.pso_engine.profiler = Profiler() if self.profile_check.isChecked() \
+                else NULL_PROFILER
+        
+        # Proyección elegida para visualizar el enjambre
+        if self.projection_combo.currentText() == 'PCA':
+            self.worker.projection = PCAProjection(dimensions)
+        else:
+            axes = (self.axis_x_spin.value(), self.axis_y_spin.value())
+            self.worker.projection = AxisProjection(dimensions, axes)
+        self.worker.optimum = KNOWN_OPTIMA.get(objective)
         
-        self.pso_engine.initialize([initial_x, initial_y], num_particles, max_iter)
+        # La posición inicial (X, Y) se repite en las dimensiones restantes
+        initial_position = np.resize([initial_x, initial_y], dimensions)
+        self.pso_engine.initialize(initial_position, num_particles, max_iter)
+        self.render_profiler.reset()
         
-        self.update_plot()
-        self.update_stats()
+        self.worker.publish(force_landscape=True)
+        self.render_latest()
         self.start_button.setText('▶ Iniciar')
     
     def start_pso(self):
@@ -363,39 +644,58 @@ class PSOVisualizerWindow(QMainWindow):
         if self.is_running:
             # Pausar
             self.is_running = False
+            self.worker.stop()
             self.timer.stop()
+            self.render_latest()
             self.start_button.setText('▶ Continuar')
         else:
             # Iniciar/Continuar
-            if self.pso_engine.current_iteration == 0:
+            if self.pso_engine.current_iteration == 0 or self.pso_engine.stop_reason is not None:
                 self.reset_pso()
             
             self.is_running = True
-            self.timer.start(self.speed_slider.value())
+            self.worker.delay_ms = self.speed_slider.value()
+            self.worker.start()
+            self.timer.start(FRAME_INTERVAL_MS)
             self.start_button.setText('⏸ Pausar')
     
-    def step_pso(self):
-        """Ejecutar un paso del algoritmo"""
-        continue_running = self.pso_engine.step()
-        
-        self.update_plot()
-        self.update_stats()
+    def render_latest(self):
+        """Renderizar la instantánea más reciente (las intermedias se descartan)"""
+        self.rendered_version, snapshot = self.worker.latest(self.rendered_version)
+        if snapshot is None:
+            return
+        if snapshot.landscape is not None:
+            self.draw_landscape(snapshot.landscape)
+        # El renderizado se mide en su propio perfil (otro hilo, otra escala de tiempo)
+        with self.render_profiler.phase('update_plot'):
+            self.update_plot(snapshot)
+        self.update_stats(snapshot.stats)
+    
+    def on_optimization_finished(self):
+        """Mostrar el resultado cuando el hilo del motor termina"""
+        # Optimización completada
+        self.is_running = False
+        self.timer.stop()
+        self.worker.wait()
+        self.render_latest()
+        self.start_button.setText('▶ Iniciar')
         
-        if not continue_running:
-            # Optimización completada
-            self.is_running = False
-            self.timer.stop()
-            self.start_button.setText('▶ Iniciar')
-            
-            stats = self.pso_engine.get_stats()
-            QMessageBox.information(
-                self,
-                'Optimización Completada',
-                f"¡Optimización completada!\n\n"
-                f"Mejor posición: [{stats['best_position'][0]:.4f}, {stats['best_position'][1]:.4f}]\n"
-                f"Mejor error: {stats['best_error']:.6f}"
-            )
-
+        stats = self.pso_engine.get_stats()
+        QMessageBox.information(
+            self,
+            'Optimización Completada',
+            f"¡Optimización completada!\n\n"
+            f"Mejor posición: [{stats['best_position'][0]:.4f}, {stats['best_position'][1]:.4f}]\n"
+            f"Mejor error: {stats['best_error']:.6f}\n"
+            f"Motivo de parada: {stats['stop_reason']}"
+        )
+    
+    def closeEvent(self, event):
+        """Detener el hilo del motor al cerrar la ventana"""
+        self.timer.stop()
+        self.worker.stop()
+        self.pso_engine.close()
+        super().closeEvent(event)
 
 def main():
     """Función principal"""
@@ -0,0 +1,136 @@
+"""
+PSO - Historial de trayectorias en un búfer circular preasignado
+Archivo: history.py
+
+El historial se registra como observador del motor:
+    history = TrajectoryHistory(capacity=1000, path='trayectoria.npy')
+    engine.add_observer(history.record, every=10)
+Cada muestra ocupa una ranura de un arreglo estructurado de tamaño fijo
+(iteración, mejor error, posiciones (N, D)); al llenarse se sobrescriben
+las muestras más antiguas, de modo que la memoria no crece con la duración
+de la ejecución. Con `path` el búfer es un archivo .npy mapeado en memoria
+(load_history lo abre para reproducirlo sin cargarlo completo). Al reanudar
+desde un checkpoint, resume() reabre el archivo existente en lugar de
+truncarlo.
+"""
+
+# Importar os para comprobar si el archivo ya existe
+import os
+# Importar NumPy para el búfer y el mapeo en memoria
+import numpy as np
+
+
+class TrajectoryHistory:
+    """Búfer circular de posiciones del enjambre, en RAM o mapeado a un archivo .npy"""
+
+    def __init__(self, capacity, path=None, dtype=np.float32):
+        # Número máximo de muestras conservadas
+        self.capacity = capacity
+        # Archivo .npy del mapeo en memoria (None = búfer en RAM)
+        self.path = path
+        # Tipo de las posiciones guardadas (float32 por defecto: la mitad de memoria)
+        self.dtype = np.dtype(dtype)
+        # El búfer se reserva con la primera muestra, cuando se conoce (N, D)
+        self.buffer = None
+        # Muestras registradas en total (incluidas las sobrescritas)
+        self.count = 0
+        # Ranuras con una muestra válida y siguiente ranura a escribir
+        self.size = 0
+        self._next = 0
+
+    def _allocate(self, shape):
+        """Reservar el búfer para posiciones de forma (N, D)"""
+        record_dtype = np.dtype([
+            ('iteration', np.int64),
+            ('best_error', np.float64),
+            ('positions', self.dtype, shape),
+        ])
+        if self.path is None:
+            self.buffer = np.zeros(self.capacity, dtype=record_dtype)
+        else:
+            self.buffer = np.lib.format.open_memmap(
+                self.path, mode='w+', dtype=record_dtype, shape=(self.capacity,))
+        # Iteración -1 marca las ranuras aún no escritas
+        self.buffer['iteration'] = -1
+
+    def resume(self, iteration):
+        """Reabrir el archivo existente (modo r+) y continuar tras la muestra `iteration`
+
+        Las muestras posteriores a `iteration` (registradas después del último
+        checkpoint) se descartan porque la ejecución reanudada las repetirá.
+        Retorna False si no hay archivo que reabrir.
+        """
+        if self.path is None or not os.path.exists(self.path):
+            return False
+        buffer = np.load(self.path, mmap_mode='r+')
+        if buffer.dtype['positions'].base != self.dtype or len(buffer) != self.capacity:
+            raise ValueError(f'El historial {self.path!r} no coincide con la capacidad '
+                             f'y el tipo configurados')
+        iterations = buffer['iteration']
+        iterations[iterations > iteration] = -1
+        self.buffer = buffer
+        self._restore_cursor()
+        return True
+
+    def _restore_cursor(self):
+        """Recalcular muestras válidas y siguiente ranura a partir del búfer existente"""
+        iterations = self.buffer['iteration']
+        written = np.flatnonzero(iterations >= 0)
+        self.count = self.size = int(written.size)
+        # La siguiente ranura sigue a la muestra más reciente
+        self._next = 0 if not written.size else \
+            (int(written[np.argmax(iterations[written])]) + 1) % self.capacity
+
+    def record(self, record):
+        """Guardar un IterationRecord en la siguiente ranura (callback de observador)"""
+        if self.buffer is None:
+            self._allocate(record.positions.shape)
+        slot = self.buffer[self._next]
+        # Tras reanudar puede haber ranuras descartadas: sólo las vacías suman muestras
+        if slot['iteration'] < 0:
+            self.size += 1
+        slot['iteration'] = record.iteration
+        slot['best_error'] = record.best_error
+        slot['positions'] = record.positions
+        self._next = (self._next + 1) % self.capacity
+        self.count += 1
+
+    def __len__(self):
+        return self.size
+
+    def order(self):
+        """Índices de las ranuras escritas en orden cronológico"""
+        if self.buffer is None:
+            return np.empty(0, dtype=np.intp)
+        iterations = self.buffer['iteration']
+        written = np.flatnonzero(iterations >= 0)
+        return written[np.argsort(iterations[written], kind='stable')]
+
+    def replay(self):
+        """Recorrer las muestras en orden: genera (iteración, mejor error, posiciones)
+
+        Las posiciones son vistas del búfer: con mapeo en memoria sólo se lee
+        del disco la muestra en curso.
+        """
+        for slot in self.order():
+            sample = self.buffer[slot]
+            yield int(sample['iteration']), float(sample['best_error']), sample['positions']
+
+    def flush(self):
+        """Escribir a disco las muestras pendientes del mapeo en memoria"""
+        if isinstance(self.buffer, np.memmap):
+            self.buffer.flush()
+
+    def close(self):
+        """Cerrar el mapeo en memoria (el archivo queda listo para reproducirse)"""
+        self.flush()
+        self.buffer = None
+
+
+def load_history(path):
+    """Abrir un historial guardado en modo de sólo lectura (sin cargarlo en memoria)"""
+    buffer = np.load(path, mmap_mode='r')
+    history = TrajectoryHistory(len(buffer), path=path, dtype=buffer.dtype['positions'].base)
+    history.buffer = buffer
+    history._restore_cursor()
+    return history
@@ -0,0 +1,163 @@
+"""
+PSO - Modelo de islas: varios enjambres en procesos separados con migración
+Archivo: islands.py
+
+Cada isla es un PSOEngine independiente (semilla y parámetros propios) que
+corre en su propio proceso. Cada `migration_interval` iteraciones el
+coordinador recoge los mejores individuos de cada isla por una tubería
+(multiprocessing.Pipe) y los envía a las islas destino según la topología
+de migración ('ring' o 'full'), donde reemplazan a las peores partículas.
+Las islas sólo se sincronizan en la migración, no en cada evaluación.
+"""
+
+# Importar multiprocessing para los procesos y tuberías de las islas
+import multiprocessing
+# Importar NumPy para las posiciones migrantes
+import numpy as np
+
+# Importar la lógica del PSO
+from logic import PSOEngine
+
+
+# Claves de la configuración de una isla que no son argumentos de PSOEngine
+ISLAND_KEYS = ('num_particles', 'initial_position', 'migrants')
+
+
+def _island_main(cost_function, bounds, config, max_iterations, conn):
+    """Proceso de una isla: ejecutar iteraciones y migrar según las órdenes del coordinador"""
+    options = {k: v for k, v in config.items() if k not in ISLAND_KEYS}
+    engine = PSOEngine(cost_function=cost_function, bounds=bounds, **options)
+    initial_position = config.get('initial_position')
+    if initial_position is None:
+        initial_position = engine.rng.uniform(engine.lower_bounds, engine.upper_bounds)
+    engine.initialize(initial_position, config.get('num_particles', 15), max_iterations)
+    try:
+        while True:
+            command, argument = conn.recv()
+            if command == 'run':
+                # Ejecutar hasta `argument` iteraciones (menos si la isla termina)
+                running = True
+                for _ in range(argument):
+                    running = engine.step()
+                    if not running:
+                        break
+                positions, errors = engine.best_particles(config.get('migrants', 1))
+                conn.send((running, positions, errors, engine.get_stats()))
+            elif command == 'immigrate':
+                positions, errors = argument
+                if len(positions):
+                    engine.inject(positions, errors)
+                conn.send(None)
+            elif command == 'stop':
+                break
+    finally:
+        engine.close()
+        conn.close()
+
+
+class IslandModel:
+    """Coordinador de M enjambres en procesos separados con migración periódica"""
+
+    def __init__(self, cost_function, bounds, islands, migration_interval=10, migrants=1,
+                 migration='ring', seed=None):
+        # Función objetivo (debe poder serializarse para enviarse a los procesos)
+        self.cost_function = cost_function
+        self.bounds = bounds
+        # Configuración de cada isla: num_particles, initial_position, migrants
+        # y cualquier argumento de PSOEngine (seed, topology, coefficients, ...)
+        self.islands = [dict(island) for island in islands]
+        # Islas sin semilla propia reciben flujos independientes derivados de `seed`
+        seeds = np.random.SeedSequence(seed).spawn(len(self.islands))
+        for island, island_seed in zip(self.islands, seeds):
+            island.setdefault('migrants', migrants)
+            island.setdefault('seed', island_seed)
+        # Iteraciones entre migraciones y topología de migración ('ring' o 'full')
+        self.migration_interval = migration_interval
+        if migration not in ('ring', 'full'):
+            raise ValueError(f"Topología de migración desconocida: {migration!r} (opciones: ring, full)")
+        self.migration = migration
+        self._processes = []
+        self._connections = []
+        # Mejor solución encontrada entre todas las islas
+        self.err_best_g = np.inf
+        self.pos_best_g = None
+        self.island_stats = []
+
+    def start(self, max_iterations):
+        """Lanzar un proceso por isla"""
+        for island in self.islands:
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_island_main,
+                args=(self.cost_function, self.bounds, island, max_iterations, child_conn),
+            )
+            process.start()
+            child_conn.close()
+            self._processes.append(process)
+            self._connections.append(parent_conn)
+
+    def route(self, emigrants):
+        """Calcular los inmigrantes de cada isla a partir de los emigrantes de todas"""
+        count = len(emigrants)
+        if self.migration == 'ring':
+            # Cada isla recibe los emigrantes de la isla anterior del anillo
+            return [emigrants[(i - 1) % count] for i in range(count)]
+        # Conexión total: cada isla recibe los mejores del resto de islas
+        routes = []
+        for i in range(count):
+            others = [emigrants[j] for j in range(count) if j != i]
+            positions = np.concatenate([p for p, _ in others])
+            errors = np.concatenate([e for _, e in others])
+            best = np.argsort(errors, kind='stable')[:self.islands[i]['migrants']]
+            routes.append((positions[best], errors[best]))
+        return routes
+
+    def run(self, max_iterations):
+        """Ejecutar todas las islas hasta max_iterations (o hasta que todas terminen)"""
+        self.start(max_iterations)
+        try:
+            done = 0
+            while done < max_iterations:
+                epoch = min(self.migration_interval, max_iterations - done)
+                for conn in self._connections:
+                    conn.send(('run', epoch))
+                # Recoger resultados en orden de isla (reducción determinista)
+                replies = [conn.recv() for conn in self._connections]
+                done += epoch
+                self.island_stats = [stats for _, _, _, stats in replies]
+                for _, positions, errors, _ in replies:
+                    if len(errors) and (self.pos_best_g is None or errors[0] < self.err_best_g):
+                        self.err_best_g = float(errors[0])
+                        self.pos_best_g = positions[0].tolist()
+                if not any(running for running, _, _, _ in replies) or done >= max_iterations:
+                    break
+                # Migración: enviar a cada isla sus inmigrantes y esperar confirmación
+                routes = self.route([(positions, errors) for _, positions, errors, _ in replies])
+                for conn, migrants in zip(self._connections, routes):
+                    conn.send(('immigrate', migrants))
+                for conn in self._connections:
+                    conn.recv()
+        finally:
+            self.close()
+        return self.get_stats()
+
+    def close(self):
+        """Detener los procesos de las islas"""
+        for conn in self._connections:
+            try:
+                conn.send(('stop', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join()
+        self._processes = []
+        self._connections = []
+
+    def get_stats(self):
+        """Obtener el mejor resultado global y las estadísticas de cada isla"""
+        return {
+            'best_error': self.err_best_g,
+            'best_position': self.pos_best_g,
+            'evaluations': sum(stats['evaluations'] for stats in self.island_stats),
+            'islands': self.island_stats,
+        }
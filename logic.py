@@ -1,9 +1,31 @@
 # Importar división desde __future__ para compatibilidad Python 2/3
 from __future__ import division
-# Importar módulo random para generar números aleatorios
-import random
 # Importar módulo math para funciones matemáticas
 import math
+# Importar asyncio e inspect para el modo asíncrono (steady-state)
+import asyncio
+import inspect
+# Importar json y os para los checkpoints del enjambre
+import json
+import os
+# Importar time para medir la latencia de las evaluaciones
+import time
+# Importar namedtuple para los registros de telemetría
+from collections import namedtuple
+# Importar NumPy para el motor vectorizado
+import numpy as np
+# Importar evaluadores de fitness (serial, hilos, procesos)
+from evaluators import make_evaluator, timed_evaluate_chunk
+# Importar topologías de vecindario (gbest / lbest)
+from topologies import GlobalTopology
+# Importar programaciones de coeficientes (inercia, constricción)
+from coefficients import ConstantCoefficients
+# Importar estrategias de manejo de límites
+from boundaries import Clamp
+# Importar el manejo de restricciones
+from constraints import FeasibilityRules
+# Importar la instrumentación opcional
+from profiling import NULL_PROFILER
 
 #--- COST FUNCTION ------------------------------------------------------------+
 def func1(x):
@@ -19,98 +41,175 @@ def func1(x):
 
 
 
-#--- PARTICLE CLASS (ORIGINAL) ------------------------------------------------+
-class Particle:
-    def __init__(self, x0, num_dimensions):
-        # Lista para almacenar la posición actual de la partícula
-        self.position_i = []          # particle position
-        # Lista para almacenar la velocidad actual de la partícula
-        self.velocity_i = []          # particle velocity
-        # Lista para almacenar la mejor posición personal encontrada
-        self.pos_best_i = []          # best position individual
-        # Variable para almacenar el mejor error personal (-1 indica no inicializado)
-        self.err_best_i = -1          # best error individual
-        # Variable para almacenar el error actual de la partícula
-        self.err_i = -1               # error individual
-        
-        # Inicializar cada dimensión de la partícula
-        for i in range(0, num_dimensions):
-            # Generar velocidad inicial aleatoria entre -1 y 1
-            self.velocity_i.append(random.uniform(-1, 1))
-            # Establecer posición inicial basada en x0
-            self.position_i.append(x0[i])
-    
-    def evaluate(self, costFunc):
-        """Evaluar fitness actual - Calcula el error y actualiza el mejor personal"""
-        # Calcular el error actual usando la función de costo
-        self.err_i = costFunc(self.position_i)
-        # Verificar si este es el mejor error personal encontrado hasta ahora
-        if self.err_i < self.err_best_i or self.err_best_i == -1:
-            # Guardar una copia de la posición actual como la mejor personal
-            self.pos_best_i = list(self.position_i)
-            # Actualizar el mejor error personal
-            self.err_best_i = self.err_i
-    
-    def update_velocity(self, pos_best_g, num_dimensions):
-        """Actualizar velocidad de la partícula usando la ecuación PSO"""
-        # Peso de inercia - controla la influencia de la velocidad anterior
-        w = 0.5       # constant inertia weight
-        # Constante cognitiva - influencia del mejor personal
-        c1 = 1        # cognative constant
-        # Constante social - influencia del mejor global
-        c2 = 2        # social constant
-        
-        # Actualizar velocidad en cada dimensión
-        for i in range(0, num_dimensions):
-            # Generar número aleatorio para componente cognitiva
-            r1 = random.random()
-            # Generar número aleatorio para componente social
-            r2 = random.random()
-            # Calcular componente cognitiva (atracción hacia mejor personal)
-            vel_cognitive = c1 * r1 * (self.pos_best_i[i] - self.position_i[i])
-            # Calcular componente social (atracción hacia mejor global)
-            vel_social = c2 * r2 * (pos_best_g[i] - self.position_i[i])
-            # Aplicar ecuación de actualización de velocidad PSO
-            self.velocity_i[i] = w * self.velocity_i[i] + vel_cognitive + vel_social
-    
-    def update_position(self, bounds, num_dimensions):
-        """Actualizar posición basada en la velocidad y aplicar límites"""
-        # Actualizar posición en cada dimensión
-        for i in range(0, num_dimensions):
-            # Aplicar la velocidad a la posición actual
-            self.position_i[i] = self.position_i[i] + self.velocity_i[i]
-            
-            # Verificar si excede el límite superior
-            if self.position_i[i] > bounds[i][1]:
-                # Ajustar al límite superior si lo excede
-                self.position_i[i] = bounds[i][1]
-            
-            # Verificar si está por debajo del límite inferior
-            if self.position_i[i] < bounds[i][0]:
-                # Ajustar al límite inferior si está por debajo
-                self.position_i[i] = bounds[i][0]
+#--- BATCH COST FUNCTIONS -----------------------------------------------------+
+def batch_cost_function(func):
+    """Marcar una función de costo como 'batch': recibe la matriz (N, D) y retorna N errores"""
+    # El motor detecta este atributo y evalúa todo el enjambre en una sola llamada
+    func.is_batch = True
+    return func
+
+
+@batch_cost_function
+def sphere(X):
+    """Versión vectorizada de func1 - Suma de cuadrados por fila"""
+    X = np.asarray(X, dtype=float)
+    return np.einsum('ij,ij->i', X, X)
+
+
+@batch_cost_function
+def rastrigin(X):
+    """Función de Rastrigin vectorizada (mínimo 0 en el origen)"""
+    X = np.asarray(X, dtype=float)
+    return 10.0 * X.shape[1] + np.sum(X**2 - 10.0 * np.cos(2 * math.pi * X), axis=1)
+
+
+@batch_cost_function
+def rosenbrock(X):
+    """Función de Rosenbrock vectorizada (mínimo 0 en (1, ..., 1))"""
+    X = np.asarray(X, dtype=float)
+    return np.sum(100.0 * (X[:, 1:] - X[:, :-1]**2)**2 + (1 - X[:, :-1])**2, axis=1)
+
+
+@batch_cost_function
+def ackley(X):
+    """Función de Ackley vectorizada (mínimo 0 en el origen)"""
+    X = np.asarray(X, dtype=float)
+    d = X.shape[1]
+    term1 = -20.0 * np.exp(-0.2 * np.sqrt(np.sum(X**2, axis=1) / d))
+    term2 = -np.exp(np.sum(np.cos(2 * math.pi * X), axis=1) / d)
+    return term1 + term2 + 20.0 + math.e
+
+
+@batch_cost_function
+def griewank(X):
+    """Función de Griewank vectorizada (mínimo 0 en el origen)"""
+    X = np.asarray(X, dtype=float)
+    i = np.sqrt(np.arange(1, X.shape[1] + 1))
+    return 1.0 + np.sum(X**2, axis=1) / 4000.0 - np.prod(np.cos(X / i), axis=1)
+
+
+# Funciones de prueba disponibles por nombre
+BENCHMARK_FUNCTIONS = {
+    'sphere': sphere,
+    'rastrigin': rastrigin,
+    'rosenbrock': rosenbrock,
+    'ackley': ackley,
+    'griewank': griewank,
+}
+
+
+#--- TELEMETRY ----------------------------------------------------------------+
+# Registro ligero de una iteración. `positions` y `best_positions` son vistas
+# de sólo lectura (sin copia) de las matrices del motor: reflejan el estado
+# vigente, por lo que quien necesite conservarlas debe copiarlas.
+IterationRecord = namedtuple('IterationRecord', [
+    'iteration', 'best_error', 'best_position', 'evaluations', 'positions', 'best_positions',
+])
+
+
+def readonly_view(array):
+    """Crear una vista de sólo lectura (sin copia) de un arreglo"""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
 
 #--- PSO ENGINE ---------------------------------------------------------------+
 class PSOEngine:
-    """Motor del algoritmo PSO - Lógica pura sin interfaz"""
+    """Motor del algoritmo PSO - Lógica pura sin interfaz (vectorizado con NumPy)"""
     
-    def __init__(self, cost_function=func1, bounds=[(-10, 10), (-10, 10)]):
+    def __init__(self, cost_function=func1, bounds=[(-10, 10), (-10, 10)], evaluator='serial',
+                 cache=None, seed=None, termination=None, checkpoint_path=None,
+                 checkpoint_every=0, topology=None, coefficients=None, v_max=None,
+                 boundary=None, constraints=None, constraint_handling=None, dtype=np.float64,
+                 surrogate=None, profiler=None):
         # Función objetivo a optimizar (minimizar)
         self.cost_function = cost_function
+        # Restricciones g(x) <= 0, evaluadas antes del objetivo (ver constraints.py)
+        self.constraints = list(constraints or [])
+        self.constraint_handling = constraint_handling if constraint_handling is not None \
+            else FeasibilityRules()
+        # Evaluador del enjambre: nombre de backend ('serial', 'thread', 'process') o instancia
+        if isinstance(evaluator, str):
+            evaluator = make_evaluator(evaluator, cost_function)
+        self.evaluator = evaluator
+        # Caché opcional de fitness (FitnessCache) delante de la función de costo
+        self.cache = cache
+        # Sustituto opcional que pre-filtra candidatos (ver surrogate.py; sólo modo síncrono)
+        self.surrogate = surrogate
+        # Criterios de terminación adicionales a max_iterations (ver criteria.py)
+        self.termination = list(termination or [])
+        # Motivo por el que terminó la optimización (None mientras continúa)
+        self.stop_reason = None
+        # Topología de vecindario (gbest por defecto, ver topologies.py)
+        self.topology = topology if topology is not None else GlobalTopology()
+        # Instrumentación de fases (desactivada por defecto, ver profiling.py)
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+        # Observadores de telemetría: lista de (callback, cada cuántas iteraciones)
+        self.observers = []
+        # Checkpoint automático cada `checkpoint_every` iteraciones (0 = desactivado)
+        if checkpoint_every and not checkpoint_path:
+            raise ValueError('checkpoint_every requiere checkpoint_path')
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
         # Límites del espacio de búsqueda para cada dimensión
         self.bounds = bounds
         # Número de dimensiones del problema (basado en los límites)
         self.num_dimensions = len(bounds)
+        # Límites inferior y superior como arreglos para las operaciones vectorizadas
+        self.lower_bounds = np.array([b[0] for b in bounds], dtype=float)
+        self.upper_bounds = np.array([b[1] for b in bounds], dtype=float)
+        # Estrategia al salir de los límites (recorte por defecto, ver boundaries.py)
+        self.boundary = boundary if boundary is not None else Clamp()
+        
+        # Programación de los coeficientes de la ecuación de velocidad (ver coefficients.py)
+        self.coefficients = coefficients if coefficients is not None else ConstantCoefficients()
+        # Coeficientes vigentes (los fija la programación en cada iteración)
+        self.w = 0.5       # constant inertia weight
+        self.c1 = 1        # cognative constant
+        self.c2 = 2        # social constant
+        # Velocidad máxima por dimensión (escalar o (D,); None = sin límite)
+        self.v_max = None if v_max is None else np.broadcast_to(
+            np.asarray(v_max, dtype=float), (self.num_dimensions,)).copy()
+        # Fracción de partículas que mejoraron su mejor personal en la última iteración
+        self.success_rate = 0.0
+        self._improvements = 0
         
-        # Lista para almacenar todas las partículas del enjambre
-        self.swarm = []
-        # Lista para almacenar la mejor posición global encontrada
-        self.pos_best_g = []
-        # Variable para almacenar el mejor error global (-1 indica no inicializado)
-        self.err_best_g = -1
+        # Secuencia de semillas del motor (entero, SeedSequence o None = entropía del sistema)
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) \
+            else np.random.SeedSequence(seed)
+        # Generador propio del motor: no toca el estado aleatorio global del proceso
+        self.rng = np.random.Generator(np.random.PCG64(self.seed_sequence))
+        
+        # Tipo de las matrices (N, D): float32 reduce a la mitad la memoria del enjambre
+        self.dtype = np.dtype(dtype)
+        # Matrices (N, D) con el estado del enjambre
+        self.positions = np.empty((0, self.num_dimensions), dtype=self.dtype)
+        self.velocities = np.empty((0, self.num_dimensions), dtype=self.dtype)
+        self.pos_best = np.empty((0, self.num_dimensions), dtype=self.dtype)
+        # Vectores (N,) con el error actual y el mejor error personal
+        self.errors = np.empty(0)
+        self.err_best = np.empty(0)
+        # Violación total actual y violación del mejor personal (sólo con restricciones)
+        self.violations = np.empty(0)
+        self.viol_best = np.empty(0)
+        # Mejor posición global encontrada (vacía si no existe)
+        self.pos_best_g = np.empty(0)
+        # Mejor error global (infinito mientras no exista mejor global)
+        self.err_best_g = np.inf
+        # Violación comparada del mejor global (0 con penalización: ya está en el error)
+        self.viol_best_g = np.inf
+        # Violación real del mejor global, sin combinar (0 = factible)
+        self.violation_g = np.inf
         # Contador de la iteración actual
         self.current_iteration = 0
-        # Número máximo de iteraciones permitidas
+        # Contador de evaluaciones de la función de costo
+        self.num_evaluations = 0
+        # Contadores de restricciones: puntos verificados, infactibles y objetivos omitidos
+        self.constraint_checks = 0
+        self.infeasible_evaluations = 0
+        self.skipped_evaluations = 0
+        # Número máximo de iteraciones permitidas (None = sin límite, sólo criterios)
         self.max_iterations = 30
         # Número de partículas en el enjambre
         self.num_particles = 15
@@ -119,74 +218,620 @@ class PSOEngine:
         """Inicializar el enjambre con parámetros específicos"""
         # Establecer número de partículas a crear
         self.num_particles = num_particles
+        # Sin max_iterations sólo los criterios pueden detener la optimización
+        if max_iterations is None and not self.termination:
+            raise ValueError('max_iterations=None requiere al menos un criterio de terminación')
         # Establecer número máximo de iteraciones
         self.max_iterations = max_iterations
-        # Reinicializar lista de partículas
-        self.swarm = []
         # Reinicializar mejor posición global
-        self.pos_best_g = []
+        self.pos_best_g = np.empty(0)
         # Reinicializar mejor error global
-        self.err_best_g = -1
-        # Reinicializar contador de iteraciones
+        self.err_best_g = np.inf
+        self.viol_best_g = np.inf
+        self.violation_g = np.inf
+        # Reinicializar contadores de iteraciones y evaluaciones
         self.current_iteration = 0
+        self.num_evaluations = 0
+        self.constraint_checks = 0
+        self.infeasible_evaluations = 0
+        self.skipped_evaluations = 0
+        if self.surrogate is not None:
+            self.surrogate.reset()
+        self.profiler.reset()
+        # Reinicializar criterios de terminación
+        self.stop_reason = None
+        for criterion in self.termination:
+            criterion.reset(self)
+        
+        shape = (num_particles, self.num_dimensions)
+        # Todas las partículas parten de la posición inicial
+        self.positions = np.tile(np.asarray(initial_position, dtype=self.dtype), (num_particles, 1))
+        # Velocidades iniciales aleatorias entre -1 y 1
+        self.velocities = self.rng.uniform(-1, 1, size=shape).astype(self.dtype, copy=False)
+        # Mejores personales aún no definidas (error infinito)
+        self.pos_best = self.positions.copy()
+        self.err_best = np.full(num_particles, np.inf)
+        self.errors = np.full(num_particles, np.inf)
+        self.violations = np.zeros(num_particles)
+        self.viol_best = np.full(num_particles, np.inf)
+        # Precalcular los índices de vecinos de la topología
+        self.topology.reset(num_particles, self.rng)
+        # Reiniciar coeficientes y tasa de éxito
+        self.success_rate = 0.0
+        self._improvements = 0
+        self.coefficients.reset(self)
+    
+    def spawn_seeds(self, count):
+        """Derivar `count` SeedSequence independientes (para trabajadores, islas, etc.)
+        
+        Los flujos derivados son estadísticamente independientes del generador
+        del motor y entre sí, y reproducibles para una misma semilla.
+        """
+        return self.seed_sequence.spawn(count)
+    
+    def evaluate_positions(self, positions):
+        """Evaluar la función de costo para cada fila de la matriz de posiciones"""
+        # Con caché, sólo los puntos no visitados llegan a la función de costo
+        if self.cache is not None:
+            return self.cache.evaluate(positions, self._evaluate_uncached)
+        return self._evaluate_uncached(positions)
+    
+    def evaluate_swarm(self, positions):
+        """Evaluar restricciones y objetivo; retorna (errores, violaciones o None)
         
-        # Crear cada partícula del enjambre
-        for i in range(num_particles):
-            # Crear nueva partícula con posición inicial y agregar al enjambre
-            self.swarm.append(Particle(initial_position, self.num_dimensions))
+        Sin restricciones ni sustituto equivale a evaluate_positions. Con
+        restricciones, el objetivo sólo se calcula en las filas que el
+        manejador requiere (las factibles con las reglas de Deb); con
+        sustituto, sólo en la fracción más prometedora de ellas. El resto
+        recibe error infinito (sin mejora en esta iteración).
+        """
+        if not self.constraints and self.surrogate is None:
+            return self.evaluate_positions(positions), None
+        violations = None
+        needs = np.ones(len(positions), dtype=bool)
+        if self.constraints:
+            violations, needs = self.screen_constraints(positions)
+            self.violations = violations
+        if self.surrogate is not None:
+            # Pre-filtrar con el sustituto las filas que aún requieren el objetivo
+            rows = np.flatnonzero(needs)
+            needs[rows] = self.surrogate.screen(positions[rows], self.err_best[rows])
+        errors = np.full(len(positions), np.inf)
+        if needs.any():
+            errors[needs] = self.evaluate_positions(positions[needs])
+            if self.surrogate is not None:
+                # Reentrenar de forma incremental con las evaluaciones reales
+                self.surrogate.add(positions[needs], errors[needs])
+        if violations is None:
+            return errors, None
+        return self.constraint_handling.combine(errors, violations)
+    
+    def screen_constraints(self, positions):
+        """Evaluar las restricciones de cada fila; retorna (violaciones, máscara del objetivo)"""
+        violations = self.constraint_handling.violation(self.constraints, positions)
+        needs = self.constraint_handling.needs_objective(violations)
+        self.constraint_checks += len(positions)
+        self.infeasible_evaluations += int(np.count_nonzero(violations > 0))
+        self.skipped_evaluations += len(positions) - int(np.count_nonzero(needs))
+        return violations, needs
+    
+    def _evaluate_uncached(self, positions):
+        """Evaluar con el evaluador configurado y contar las llamadas reales"""
+        self.num_evaluations += len(positions)
+        # El evaluador prefiere la forma batch y retorna los errores en orden de filas
+        if not self.profiler.enabled:
+            return self.evaluator.evaluate(positions)
+        # Latencia de cada llamada a la función de costo, medida en el trabajador
+        errors, calls = self.evaluator.evaluate_timed(positions)
+        for count, elapsed in calls:
+            self.profiler.record_evaluation(count, elapsed)
+        return errors
     
     def step(self):
         """Ejecutar un paso del algoritmo PSO"""
-        # Verificar si se alcanzó el máximo de iteraciones
-        if self.current_iteration >= self.max_iterations:
+        # Verificar si se alcanzó el máximo de iteraciones o algún criterio de parada
+        if self.check_termination():
             # Retornar False para indicar que la optimización terminó
             return False  # Optimización completada
         
-        # Evaluar todas las partículas del enjambre
-        for j in range(len(self.swarm)):
-            # Evaluar fitness de la partícula actual
-            self.swarm[j].evaluate(self.cost_function)
-            
-            # Verificar si esta partícula encontró un nuevo mejor global
-            if self.swarm[j].err_i < self.err_best_g or self.err_best_g == -1:
-                # Guardar copia de la posición como nuevo mejor global
-                self.pos_best_g = list(self.swarm[j].position_i)
-                # Actualizar el mejor error global
-                self.err_best_g = float(self.swarm[j].err_i)
+        profiler = self.profiler
+        # Evaluar todas las partículas del enjambre (restricciones primero)
+        with profiler.phase('evaluation'):
+            errors, violations = self.evaluate_swarm(self.positions)
+        with profiler.phase('best_tracking'):
+            # Actualizar mejores personales y mejor global
+            previous_best = self.err_best_g
+            self.update_bests(errors, violations=violations)
+            # Adaptar topología y coeficientes al resultado de la evaluación
+            self.adapt(previous_best)
         
         # Actualizar velocidades y posiciones de todas las partículas
-        for j in range(len(self.swarm)):
-            # Actualizar velocidad usando el mejor global
-            self.swarm[j].update_velocity(self.pos_best_g, self.num_dimensions)
-            # Actualizar posición basada en la nueva velocidad
-            self.swarm[j].update_position(self.bounds, self.num_dimensions)
+        with profiler.phase('velocity'):
+            self.update_velocities()
+        with profiler.phase('position'):
+            self.update_positions()
         
         # Incrementar contador de iteraciones
         self.current_iteration += 1
+        with profiler.phase('criteria'):
+            # Evaluar criterios de parada con el estado de esta iteración
+            self.check_criteria()
+        # Guardar checkpoint periódico
+        if self.checkpoint_every and self.current_iteration % self.checkpoint_every == 0:
+            with profiler.phase('checkpoint'):
+                self.save_checkpoint(self.checkpoint_path)
+        # Notificar a los observadores según su muestreo
+        if self.observers:
+            with profiler.phase('observers'):
+                self.notify_observers()
         # Retornar True para indicar que debe continuar
         return True  # Continuar
     
-    def get_particles_positions(self):
-        """Obtener posiciones actuales de todas las partículas (solo 2D)"""
-        # Retornar lista de tuplas con coordenadas x,y de cada partícula
-        return [(p.position_i[0], p.position_i[1]) for p in self.swarm]
+    def check_termination(self):
+        """Indicar si la optimización terminó (registra el motivo en stop_reason)"""
+        if self.stop_reason is None and self.max_iterations is not None \
+                and self.current_iteration >= self.max_iterations:
+            self.stop_reason = 'max_iterations'
+        return self.stop_reason is not None
+    
+    def check_criteria(self):
+        """Evaluar los criterios de terminación y registrar el primero que se cumpla"""
+        for criterion in self.termination:
+            reason = criterion.check(self)
+            if reason is not None:
+                self.stop_reason = reason
+                break
+    
+    def adapt(self, previous_best):
+        """Adaptar topología y coeficientes tras la fase de evaluación de una iteración"""
+        # Topologías dinámicas reaccionan a si el mejor global mejoró
+        self.topology.update(self.rng, self.err_best_g != previous_best)
+        # Tasa de éxito de la iteración para las programaciones adaptativas
+        self.success_rate = self._improvements / self.num_particles
+        self._improvements = 0
+        self.coefficients.update(self)
+    
+    def update_bests(self, errors, index=slice(None), violations=None):
+        """Registrar errores evaluados y actualizar mejores personales y global
+        
+        `index` es un slice sobre las filas del enjambre (todo el enjambre por
+        defecto, o `slice(i, i + 1)` para una sola partícula en modo asíncrono).
+        Con `violations` las partículas se comparan por (violación, error).
+        """
+        # Vistas sobre las filas afectadas
+        positions = self.positions[index]
+        err_best = self.err_best[index]
+        pos_best = self.pos_best[index]
+        self.errors[index] = errors
+        
+        # Actualizar mejores personales donde el error (o la violación) mejoró
+        if violations is None:
+            improved = errors < err_best
+        else:
+            viol_best = self.viol_best[index]
+            improved = (violations < viol_best) | ((violations == viol_best) & (errors < err_best))
+            viol_best[improved] = violations[improved]
+        pos_best[improved] = positions[improved]
+        err_best[improved] = errors[improved]
+        self._improvements += int(np.count_nonzero(improved))
+        
+        # Verificar si alguna partícula encontró un nuevo mejor global
+        # (argmin elige el primer índice en caso de empate: reducción determinista)
+        if violations is None:
+            j = int(np.argmin(errors))
+            better = errors[j] < self.err_best_g or not self.pos_best_g.size
+        else:
+            # Menor error entre las filas de menor violación
+            candidates = np.flatnonzero(violations == violations.min())
+            j = int(candidates[np.argmin(errors[candidates])])
+            better = not self.pos_best_g.size or violations[j] < self.viol_best_g or (
+                violations[j] == self.viol_best_g and errors[j] < self.err_best_g)
+            if better:
+                self.viol_best_g = float(violations[j])
+        if better:
+            # Guardar copia de la posición como nuevo mejor global
+            self.pos_best_g = positions[j].copy()
+            # Actualizar el mejor error global
+            self.err_best_g = float(errors[j])
+            if self.constraints:
+                # Violación real de la fila (el manejador puede haberla combinado con el error)
+                self.violation_g = float(self.violations[index][j])
+    
+    def update_velocities(self, index=slice(None)):
+        """Actualizar velocidades del enjambre (o de las filas `index`) con la ecuación PSO"""
+        positions = self.positions[index]
+        velocities = self.velocities[index]
+        # Matrices de números aleatorios para componentes cognitiva y social (una sola llamada)
+        r1, r2 = self.rng.random((2,) + positions.shape, dtype=self.dtype)
+        # Componente cognitiva (atracción hacia mejor personal)
+        cognitive = self.pos_best[index] - positions
+        cognitive *= r1
+        cognitive *= self.c1
+        # Componente social (atracción hacia el mejor del vecindario)
+        social = self.neighborhood_best(index) - positions
+        social *= r2
+        social *= self.c2
+        # Aplicar ecuación de actualización de velocidad PSO
+        velocities *= self.w
+        velocities += cognitive
+        velocities += social
+        # Limitar la velocidad por dimensión
+        if self.v_max is not None:
+            np.clip(velocities, -self.v_max, self.v_max, out=velocities)
+    
+    def neighborhood_best(self, index=slice(None)):
+        """Obtener la mejor posición personal del vecindario de cada fila `index`
+        
+        Con la topología global es simplemente pos_best_g; con vecindarios
+        (N, k) se resuelve con una indexación vectorizada en O(N·k).
+        """
+        neighbors = self.topology.neighbors
+        if neighbors is None:
+            return self.pos_best_g
+        neighbors = neighbors[index]
+        # Índice del vecino con mejor mejor personal en cada fila
+        best = np.argmin(self.personal_best_key()[neighbors], axis=1)
+        return self.pos_best[neighbors[np.arange(len(neighbors)), best]]
+    
+    def personal_best_key(self):
+        """Clave escalar para ordenar los mejores personales (menor es mejor)
+        
+        Sin restricciones es err_best; con restricciones, el rango de cada
+        partícula en el orden lexicográfico (violación, error).
+        """
+        if not self.constraints:
+            return self.err_best
+        order = np.lexsort((self.err_best, self.viol_best))
+        rank = np.empty(len(order))
+        rank[order] = np.arange(len(order))
+        return rank
+    
+    def update_positions(self, index=slice(None)):
+        """Actualizar posiciones (o las filas `index`) con la velocidad y aplicar límites"""
+        positions = self.positions[index]
+        velocities = self.velocities[index]
+        # Aplicar la velocidad a la posición actual
+        positions += velocities
+        # Corregir las coordenadas fuera de los límites según la estrategia
+        self.boundary.apply(positions, velocities, self.lower_bounds, self.upper_bounds, self.rng)
+    
+    async def run_async(self, max_concurrency=None, executor=None):
+        """Ejecutar el PSO en modo asíncrono (steady-state) hasta max_iterations o un criterio
+        
+        Cada partícula se mueve en cuanto termina su propia evaluación, usando
+        el pos_best_g vigente en ese momento, sin esperar al resto del enjambre.
+        Las funciones de costo corrutina (`async def`) se esperan directamente;
+        las funciones normales se ejecutan en `executor` (por defecto, el pool
+        de hilos de asyncio). Una iteración equivale a N evaluaciones. El
+        sustituto no se aplica aquí: el pre-filtrado necesita un lote de candidatos.
+        """
+        # Presupuesto total de actualizaciones equivalente al modo síncrono
+        if self.max_iterations is None:
+            budget = math.inf
+        else:
+            budget = (self.max_iterations - self.current_iteration) * self.num_particles
+        start_iteration = self.current_iteration
+        # Limitar el número de evaluaciones simultáneas
+        semaphore = asyncio.Semaphore(max_concurrency or self.num_particles)
+        is_coroutine = inspect.iscoroutinefunction(self.cost_function)
+        loop = asyncio.get_running_loop()
+        # Actualizaciones lanzadas (se reservan antes de esperar) y completadas
+        issued = 0
+        completed = 0
+        # Mejor global al inicio de la iteración en curso (para topologías dinámicas)
+        iteration_best = self.err_best_g
+        profiler = self.profiler
+        
+        async def evaluate(i, x):
+            """Evaluar la posición (copia) de la partícula i; retorna (errores, violaciones o None)"""
+            if self.constraints:
+                # Restricciones primero: omitir el objetivo si el manejador no lo requiere
+                violations, needs = self.screen_constraints(x[np.newaxis])
+                self.violations[i] = violations[0]
+                if needs[0]:
+                    error = await evaluate_objective(x)
+                else:
+                    # Ceder el control: una partícula infactible no debe acaparar el presupuesto
+                    await asyncio.sleep(0)
+                    error = np.inf
+                errors, violations = self.constraint_handling.combine(np.array([error]), violations)
+                return errors, violations
+            return np.array([await evaluate_objective(x)]), None
+        
+        async def evaluate_objective(x):
+            """Evaluar el objetivo en una posición pasando por la caché y el semáforo"""
+            key = None
+            if self.cache is not None:
+                key = self.cache.keys_for(x[np.newaxis])[0]
+                error = self.cache.get(key)
+                if error is not None:
+                    # Ceder el control para no acaparar el presupuesto con aciertos
+                    await asyncio.sleep(0)
+                    return error
+            async with semaphore:
+                self.num_evaluations += 1
+                if is_coroutine:
+                    start = time.perf_counter()
+                    error = float(await self.cost_function(x))
+                    calls = [(1, time.perf_counter() - start)]
+                else:
+                    # Medir dentro del ejecutor: la espera en su cola no cuenta como latencia
+                    errors, calls = await loop.run_in_executor(
+                        executor, timed_evaluate_chunk, self.cost_function, x[np.newaxis])
+                    error = float(errors[0])
+                for count, elapsed in calls:
+                    self.profiler.record_evaluation(count, elapsed)
+            if key is not None:
+                self.cache.put(key, error)
+            return error
+        
+        async def particle_loop(i):
+            """Ciclo evaluar-mover de una partícula"""
+            nonlocal issued, completed, iteration_best
+            row = slice(i, i + 1)
+            while issued < budget and self.stop_reason is None:
+                issued += 1
+                errors, violations = await evaluate(i, self.positions[i].copy())
+                # Actualizar mejores y mover la partícula de inmediato
+                with profiler.phase('best_tracking'):
+                    self.update_bests(errors, row, violations)
+                with profiler.phase('velocity'):
+                    self.update_velocities(row)
+                with profiler.phase('position'):
+                    self.update_positions(row)
+                completed += 1
+                # Cada N actualizaciones completadas cuentan como una iteración
+                if completed % self.num_particles == 0:
+                    self.current_iteration = start_iteration + completed // self.num_particles
+                    self.adapt(iteration_best)
+                    iteration_best = self.err_best_g
+                    self.check_criteria()
+                    if self.observers:
+                        self.notify_observers()
+        
+        await asyncio.gather(*(particle_loop(i) for i in range(self.num_particles)))
+        self.check_termination()
+        return self.get_stats()
+    
+    def best_particles(self, count):
+        """Obtener las `count` mejores posiciones personales y sus errores (de mejor a peor)"""
+        count = min(count, self.num_particles)
+        key = self.personal_best_key()
+        best = np.argpartition(key, count - 1)[:count]
+        best = best[np.argsort(key[best], kind='stable')]
+        return self.pos_best[best].copy(), self.err_best[best].copy()
+    
+    def inject(self, positions, errors):
+        """Reemplazar las partículas con peor mejor personal por posiciones ya evaluadas
+        
+        Usado para la migración entre enjambres: cada partícula recibida parte
+        de la posición inmigrante, que pasa a ser también su mejor personal.
+        """
+        count = min(len(positions), self.num_particles)
+        positions = np.asarray(positions[:count], dtype=self.dtype)
+        errors = np.asarray(errors[:count], dtype=float)
+        worst = np.argpartition(-self.personal_best_key(), count - 1)[:count]
+        self.positions[worst] = positions
+        self.pos_best[worst] = positions
+        self.err_best[worst] = errors
+        self.errors[worst] = errors
+        # Los inmigrantes con error finito fueron factibles en su enjambre de origen
+        violations = np.where(np.isfinite(errors), 0.0, np.inf)
+        if self.constraints:
+            self.viol_best[worst] = violations
+            self.violations[worst] = violations
+        # Actualizar el mejor global si algún inmigrante lo mejora
+        j = int(np.argmin(errors))
+        if not self.pos_best_g.size or errors[j] < self.err_best_g or (
+                self.constraints and violations[j] < self.viol_best_g):
+            self.pos_best_g = positions[j].copy()
+            self.err_best_g = float(errors[j])
+            self.viol_best_g = float(violations[j])
+            self.violation_g = float(violations[j])
+    
+    def run(self, sample_every=1):
+        """Ejecutar hasta terminar, generando un IterationRecord cada `sample_every` iteraciones
+        
+        La última iteración se genera siempre, aunque no coincida con el muestreo.
+        """
+        last_yielded = None
+        while self.step():
+            if self.current_iteration % sample_every == 0:
+                last_yielded = self.current_iteration
+                yield self.make_record()
+        if self.current_iteration != last_yielded:
+            yield self.make_record()
+    
+    def make_record(self):
+        """Crear el registro de telemetría de la iteración actual (sin copiar el enjambre)"""
+        return IterationRecord(
+            iteration=self.current_iteration,
+            best_error=self.err_best_g,
+            best_position=readonly_view(self.pos_best_g),
+            evaluations=self.num_evaluations,
+            positions=readonly_view(self.positions),
+            best_positions=readonly_view(self.pos_best),
+        )
+    
+    def add_observer(self, callback, every=1):
+        """Registrar callback(record) para que se llame cada `every` iteraciones"""
+        self.observers.append((callback, every))
+    
+    def remove_observer(self, callback):
+        """Eliminar un observador registrado"""
+        self.observers = [(cb, every) for cb, every in self.observers if cb is not callback]
+    
+    def notify_observers(self):
+        """Llamar a los observadores cuyo muestreo coincide con la iteración actual"""
+        record = None
+        for callback, every in self.observers:
+            if self.current_iteration % every == 0:
+                # Crear el registro sólo si algún observador lo necesita
+                if record is None:
+                    record = self.make_record()
+                callback(record)
+    
+    def save_checkpoint(self, path):
+        """Guardar el estado completo del enjambre en un archivo .npz sin comprimir
+        
+        La escritura es atómica (archivo temporal + os.replace), de modo que un
+        proceso interrumpido a mitad de escritura no corrompe el checkpoint previo.
+        """
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                positions=self.positions,
+                velocities=self.velocities,
+                pos_best=self.pos_best,
+                err_best=self.err_best,
+                errors=self.errors,
+                violations=self.violations,
+                viol_best=self.viol_best,
+                viol_best_g=np.float64(self.viol_best_g),
+                violation_g=np.float64(self.violation_g),
+                # Puntos verificados, infactibles y objetivos omitidos por las restricciones
+                constraint_counters=np.array([self.constraint_checks, self.infeasible_evaluations,
+                                              self.skipped_evaluations], dtype=np.int64),
+                pos_best_g=self.pos_best_g,
+                err_best_g=np.float64(self.err_best_g),
+                current_iteration=np.int64(self.current_iteration),
+                num_evaluations=np.int64(self.num_evaluations),
+                max_iterations=np.int64(-1 if self.max_iterations is None else self.max_iterations),
+                lower_bounds=self.lower_bounds,
+                upper_bounds=self.upper_bounds,
+                # Estado del generador aleatorio serializado como JSON
+                rng_state=np.array(json.dumps(self.rng.bit_generator.state)),
+                stop_reason=np.array(self.stop_reason or ''),
+                # Coeficientes vigentes (estado de las programaciones adaptativas)
+                coefficients=np.array([self.w, self.c1, self.c2]),
+                # Índices de vecinos (necesarios para topologías dinámicas)
+                neighbors=np.empty((0, 0), dtype=np.int64) if self.topology.neighbors is None
+                else self.topology.neighbors,
+                # Estado interno de los criterios de terminación (p. ej. Stagnation)
+                criteria_state=np.array(json.dumps(
+                    [criterion.checkpoint_state() for criterion in self.termination])),
+                # Estado adicional de las variantes del motor (p. ej. el archivo de Pareto)
+                **self.checkpoint_state(),
+            )
+        os.replace(tmp_path, path)
+    
+    def checkpoint_state(self):
+        """Arreglos adicionales que guarda el checkpoint (ninguno en el motor base)"""
+        return {}
+    
+    def restore_checkpoint_state(self, data):
+        """Restaurar los arreglos de checkpoint_state desde el archivo abierto"""
+        pass
+    
+    def load_checkpoint(self, path):
+        """Restaurar el estado guardado con save_checkpoint para continuar la optimización
+        
+        El motor debe estar configurado con la misma función de costo, límites
+        y criterios de terminación (su estado interno se restaura en orden).
+        La caché y el sustituto no se guardan: sin ellos la ejecución reanudada
+        es idéntica a la ininterrumpida; con ellos se reconstruyen desde cero
+        y pueden elegir otras evaluaciones.
+        """
+        with np.load(path) as data:
+            # Verificar que el checkpoint corresponde al mismo espacio de búsqueda
+            if not (np.array_equal(data['lower_bounds'], self.lower_bounds)
+                    and np.array_equal(data['upper_bounds'], self.upper_bounds)):
+                raise ValueError(f'El checkpoint {path!r} tiene límites distintos a los del motor')
+            # Con el enjambre ya inicializado, el tamaño debe coincidir con la configuración
+            saved_particles = len(data['positions'])
+            if len(self.positions) and saved_particles != len(self.positions):
+                raise ValueError(f'El checkpoint {path!r} tiene {saved_particles} partículas '
+                                 f'y el motor está configurado con {len(self.positions)}')
+            self.positions = data['positions'].astype(self.dtype, copy=False)
+            self.velocities = data['velocities'].astype(self.dtype, copy=False)
+            self.pos_best = data['pos_best'].astype(self.dtype, copy=False)
+            self.err_best = data['err_best']
+            self.errors = data['errors']
+            self.violations = data['violations']
+            self.viol_best = data['viol_best']
+            self.viol_best_g = float(data['viol_best_g'])
+            self.violation_g = float(data['violation_g'] if 'violation_g' in data
+                                     else data['viol_best_g'])
+            self.constraint_checks, self.infeasible_evaluations, self.skipped_evaluations = (
+                int(c) for c in data['constraint_counters'])
+            self.pos_best_g = data['pos_best_g'].astype(self.dtype, copy=False)
+            self.err_best_g = float(data['err_best_g'])
+            # Checkpoints anteriores marcan con -1 la ausencia de mejor global
+            if not self.pos_best_g.size:
+                self.err_best_g = np.inf
+            self.current_iteration = int(data['current_iteration'])
+            self.num_evaluations = int(data['num_evaluations'])
+            max_iterations = int(data['max_iterations'])
+            self.max_iterations = None if max_iterations == -1 else max_iterations
+            self.rng.bit_generator.state = json.loads(str(data['rng_state']))
+            self.stop_reason = str(data['stop_reason']) or None
+            neighbors = data['neighbors']
+            self.w, self.c1, self.c2 = (float(c) for c in data['coefficients'])
+            # Checkpoints anteriores no guardan el estado de los criterios
+            criteria_state = (json.loads(str(data['criteria_state']))
+                              if 'criteria_state' in data else [])
+            self.restore_checkpoint_state(data)
+        self.num_particles = len(self.positions)
+        # Recalcular la topología y restaurar los vecinos guardados
+        self.topology.reset(self.num_particles, np.random.default_rng())
+        if neighbors.size:
+            self.topology.neighbors = neighbors
+        for criterion in self.termination:
+            criterion.reset(self)
+        if len(criteria_state) == len(self.termination):
+            for criterion, state in zip(self.termination, criteria_state):
+                criterion.restore_checkpoint_state(state)
+    
+    def close(self):
+        """Liberar los recursos del evaluador (pools de hilos o procesos)"""
+        self.evaluator.close()
+    
+    def get_particles_positions(self, axes=(0, 1)):
+        """Obtener posiciones actuales de todas las partículas en dos ejes elegidos"""
+        # Retornar lista de tuplas con las coordenadas de los ejes de cada partícula
+        return [tuple(p) for p in self.positions[:, list(axes)].tolist()]
     
-    def get_particles_best_positions(self):
-        """Obtener mejores posiciones personales de las partículas (solo 2D)"""
-        # Retornar lista de tuplas con mejores coordenadas personales x,y
-        return [(p.pos_best_i[0], p.pos_best_i[1]) if len(p.pos_best_i) >= 2 else None 
-                for p in self.swarm]
+    def get_particles_best_positions(self, axes=(0, 1)):
+        """Obtener mejores posiciones personales de las partículas en dos ejes elegidos"""
+        # Partículas sin mejor personal (aún no evaluadas) se reportan como None
+        has_best = np.isfinite(self.err_best).tolist()
+        # Retornar lista de tuplas con mejores coordenadas personales en los ejes
+        return [tuple(p) if ok else None
+                for p, ok in zip(self.pos_best[:, list(axes)].tolist(), has_best)]
     
     def get_global_best(self):
         """Obtener la mejor posición global encontrada"""
         # Retornar mejor posición global si existe, sino None
-        return self.pos_best_g if self.pos_best_g else None
+        return self.pos_best_g.tolist() if self.pos_best_g.size else None
     
     def get_stats(self):
         """Obtener estadísticas actuales del algoritmo"""
-        # Retornar diccionario con información del estado actual
-        return {
+        # Diccionario con información del estado actual
+        stats = {
             'iteration': self.current_iteration,      # Iteración actual
             'best_error': self.err_best_g,           # Mejor error encontrado
-            'best_position': self.pos_best_g if self.pos_best_g else None  # Mejor posición
-        }
\ No newline at end of file
+            'evaluations': self.num_evaluations,     # Evaluaciones de la función de costo
+            'stop_reason': self.stop_reason,         # Motivo de parada (None si continúa)
+            'best_position': self.get_global_best()  # Mejor posición
+        }
+        # Aciertos, fallos y tamaño de la caché de fitness
+        if self.cache is not None:
+            stats.update(self.cache.get_stats())
+        # Tiempos por fase e histograma de latencias (sólo con instrumentación)
+        if self.profiler.enabled:
+            stats['profile'] = self.profiler.get_stats()
+        # Predicciones y evaluaciones ahorradas por el sustituto
+        if self.surrogate is not None:
+            stats.update(self.surrogate.get_stats())
+        # Estadísticas de violación de restricciones
+        if self.constraints:
+            stats.update({
+                'best_violation': self.violation_g,              # Violación del mejor global (0 = factible)
+                'infeasible_particles': int(np.count_nonzero(self.violations > 0)),
+                'mean_violation': float(self.violations.mean()) if self.violations.size else 0.0,
+                'constraint_checks': self.constraint_checks,     # Puntos verificados
+                'infeasible_evaluations': self.infeasible_evaluations,
+                'skipped_evaluations': self.skipped_evaluations,  # Objetivos omitidos
+            })
+        return stats
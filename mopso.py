@@ -0,0 +1,357 @@
+"""
+PSO - Optimización multiobjetivo (MOPSO) con archivo de Pareto
+Archivo: mopso.py
+
+La función de costo retorna un vector de M objetivos por partícula (forma
+batch (N, M) o escalar con M valores). En lugar de un único mejor global,
+el motor mantiene un archivo acotado con las soluciones no dominadas
+encontradas; cuando se llena, se descartan las de menor distancia de
+hacinamiento (crowding distance) para conservar un frente bien repartido.
+Cada partícula sigue a un líder del archivo elegido por torneo binario
+según esa misma distancia, de modo que una sola ejecución cubre el frente.
+"""
+
+# Importar bisect para el barrido de frentes con dos objetivos
+import bisect
+# Importar NumPy para las comparaciones de dominancia vectorizadas
+import numpy as np
+
+# Importar la lógica del PSO
+from logic import PSOEngine, batch_cost_function
+# Criterios basados en el mejor error global (sin sentido en modo multiobjetivo)
+from criteria import Stagnation, TargetError
+
+
+#--- FUNCIONES DE PRUEBA MULTIOBJETIVO ---------------------------------------+
+@batch_cost_function
+def schaffer(X):
+    """Schaffer N.1 - Frente convexo en x0 ∈ [0, 2] (sólo usa la primera dimensión)"""
+    X = np.asarray(X)
+    return np.column_stack([X[:, 0] ** 2, (X[:, 0] - 2) ** 2])
+
+
+@batch_cost_function
+def zdt1(X):
+    """ZDT1 - Frente convexo f2 = 1 - sqrt(f1) con límites [0, 1] en cada dimensión"""
+    X = np.asarray(X)
+    f1 = X[:, 0]
+    g = 1 + 9 * X[:, 1:].mean(axis=1)
+    return np.column_stack([f1, g * (1 - np.sqrt(f1 / g))])
+
+
+@batch_cost_function
+def zdt2(X):
+    """ZDT2 - Frente cóncavo f2 = 1 - f1² con límites [0, 1] en cada dimensión"""
+    X = np.asarray(X)
+    f1 = X[:, 0]
+    g = 1 + 9 * X[:, 1:].mean(axis=1)
+    return np.column_stack([f1, g * (1 - (f1 / g) ** 2)])
+
+
+# Funciones multiobjetivo disponibles por nombre
+MULTIOBJECTIVE_FUNCTIONS = {
+    'schaffer': schaffer,
+    'zdt1': zdt1,
+    'zdt2': zdt2,
+}
+
+
+#--- DOMINANCIA Y ORDENAMIENTO ------------------------------------------------+
+def dominates(a, b):
+    """Indicar fila a fila si `a` domina a `b` (ninguno peor y al menos uno mejor)"""
+    return np.all(a <= b, axis=-1) & np.any(a < b, axis=-1)
+
+
+def non_dominated_mask(objectives, block_size=512):
+    """Máscara de las filas no dominadas de una matriz (n, M) de objetivos
+
+    Con dos objetivos basta ordenar por f1 y comparar f2 con el mínimo
+    acumulado (O(n log n)). Con más objetivos se compara por bloques de
+    filas para acotar la memoria de la matriz de dominancia. Las filas
+    repetidas se tratan igual (todas dominadas o todas no dominadas).
+    """
+    unique, inverse = np.unique(objectives, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    if unique.shape[1] == 2:
+        # np.unique deja las filas en orden lexicográfico (f1, luego f2)
+        previous_min = np.minimum.accumulate(np.concatenate([[np.inf], unique[:-1, 1]]))
+        unique_mask = unique[:, 1] < previous_min
+    else:
+        unique_mask = np.empty(len(unique), dtype=bool)
+        for start in range(0, len(unique), block_size):
+            block = unique[start:start + block_size, np.newaxis, :]
+            dominated = dominates(unique[np.newaxis, :, :], block).any(axis=1)
+            unique_mask[start:start + block_size] = ~dominated
+    return unique_mask[inverse]
+
+
+def non_dominated_sort(objectives, block_size=512):
+    """Rango de Pareto de cada fila (0 = primer frente) en una sola pasada
+
+    Con dos objetivos se recorren las filas en orden lexicográfico y cada
+    una entra al primer frente cuyo menor f2 la supera (búsqueda binaria,
+    O(n log n)). Con más objetivos se usa el ordenamiento rápido de Deb
+    et al. (2002): una matriz de dominancia (calculada por bloques) da el
+    número de dominadores de cada fila y, al retirar un frente, se restan
+    sus dominados. Las filas repetidas reciben el mismo rango.
+    """
+    unique, inverse = np.unique(objectives, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    n = len(unique)
+    ranks = np.empty(n, dtype=np.intp)
+    if n and unique.shape[1] == 2:
+        # Menor f2 de cada frente hasta el momento (creciente con el rango)
+        tails = []
+        for i, f2 in enumerate(unique[:, 1].tolist()):
+            rank = bisect.bisect_right(tails, f2)
+            if rank == len(tails):
+                tails.append(f2)
+            else:
+                tails[rank] = f2
+            ranks[i] = rank
+        return ranks[inverse]
+    # dominated[i, j]: la fila i domina a la fila j
+    dominated = np.empty((n, n), dtype=bool)
+    for start in range(0, n, block_size):
+        dominated[start:start + block_size] = dominates(
+            unique[start:start + block_size, np.newaxis, :], unique[np.newaxis, :, :])
+    counts = dominated.sum(axis=0)
+    front = np.flatnonzero(counts == 0)
+    rank = 0
+    while front.size:
+        ranks[front] = rank
+        counts[front] = -1
+        counts -= dominated[front].sum(axis=0)
+        front = np.flatnonzero(counts == 0)
+        rank += 1
+    return ranks[inverse]
+
+
+def crowding_distance(objectives):
+    """Distancia de hacinamiento de cada fila (infinita en los extremos del frente)"""
+    n = len(objectives)
+    if n <= 2:
+        return np.full(n, np.inf)
+    order = np.argsort(objectives, axis=0, kind='stable')
+    ordered = np.take_along_axis(objectives, order, axis=0)
+    span = ordered[-1] - ordered[0]
+    span[span == 0] = 1.0
+    distance = np.zeros(n)
+    # Lado del cuboide entre el vecino anterior y el siguiente en cada objetivo
+    np.add.at(distance, order[1:-1], (ordered[2:] - ordered[:-2]) / span)
+    distance[order[0]] = np.inf
+    distance[order[-1]] = np.inf
+    return distance
+
+
+#--- ARCHIVO DE PARETO --------------------------------------------------------+
+class ParetoArchive:
+    """Archivo acotado de soluciones no dominadas con poda por crowding distance"""
+
+    def __init__(self, capacity=100):
+        # Número máximo de soluciones conservadas
+        self.capacity = capacity
+        self.clear()
+
+    def clear(self):
+        """Vaciar el archivo"""
+        self.positions = None
+        self.objectives = None
+        self.crowding = np.empty(0)
+
+    def __len__(self):
+        return 0 if self.objectives is None else len(self.objectives)
+
+    def insert(self, positions, objectives):
+        """Agregar candidatos y conservar sólo los no dominados (retorna True si alguno entró)"""
+        old_size = len(self)
+        if old_size:
+            positions = np.concatenate([self.positions, positions])
+            objectives = np.concatenate([self.objectives, objectives])
+        # Descartar objetivos repetidos (se conserva la entrada más antigua)
+        _, first = np.unique(objectives, axis=0, return_index=True)
+        first.sort()
+        keep = first[non_dominated_mask(objectives[first])]
+        self.positions = positions[keep]
+        self.objectives = objectives[keep]
+        if len(keep) > self.capacity:
+            self.prune()
+        self.crowding = crowding_distance(self.objectives)
+        return bool(np.any(keep >= old_size))
+
+    def prune(self):
+        """Descartar las soluciones más hacinadas hasta respetar la capacidad"""
+        # Un exceso muy grande se recorta de una vez; el resto, de a una (más preciso)
+        if len(self) > 2 * self.capacity:
+            keep = np.sort(np.argsort(-crowding_distance(self.objectives),
+                                      kind='stable')[:2 * self.capacity])
+            self.positions, self.objectives = self.positions[keep], self.objectives[keep]
+        while len(self) > self.capacity:
+            worst = int(np.argmin(crowding_distance(self.objectives)))
+            self.positions = np.delete(self.positions, worst, axis=0)
+            self.objectives = np.delete(self.objectives, worst, axis=0)
+
+    def select_leaders(self, count, rng):
+        """Elegir `count` líderes por torneo binario: gana el de mayor crowding distance"""
+        a, b = rng.integers(0, len(self), size=(2, count))
+        winners = np.where(self.crowding[a] >= self.crowding[b], a, b)
+        return self.positions[winners]
+
+
+#--- MOTOR MOPSO --------------------------------------------------------------+
+class MOPSOEngine(PSOEngine):
+    """Motor PSO multiobjetivo: mejores personales por dominancia y líderes del archivo
+
+    Un mejor personal se reemplaza si la nueva posición lo domina; si
+    ninguna domina a la otra, se elige al azar. Con la topología global cada
+    partícula sigue a un líder del archivo; con vecindarios, al vecino de
+    menor rango de Pareto. Tras mover el enjambre se aplica la mutación
+    decreciente de Coello et al. (2004): con probabilidad
+    pm = (1 - t/T)^(5/mutation_rate) una partícula se re-muestrea en una
+    dimensión dentro de un rango proporcional a pm, lo que evita el
+    colapso prematuro del frente (mutation_rate=0 la desactiva).
+
+    err_best_g no se usa (queda en infinito), por lo que se rechazan los criterios
+    basados en el mejor error (target_error, stagnation), al igual que la
+    caché, el sustituto, las restricciones y run_async.
+    """
+
+    def __init__(self, cost_function, bounds, archive_size=100, mutation_rate=0.5, **options):
+        for option in ('cache', 'surrogate', 'constraints'):
+            if options.get(option):
+                raise ValueError(f'La opción {option!r} no está soportada en modo multiobjetivo')
+        for criterion in options.get('termination') or []:
+            if isinstance(criterion, (TargetError, Stagnation)):
+                raise ValueError(f'El criterio {type(criterion).__name__!r} no está soportado '
+                                 f'en modo multiobjetivo')
+        super().__init__(cost_function=cost_function, bounds=bounds, **options)
+        # Archivo acotado con el frente de Pareto encontrado
+        self.archive = ParetoArchive(archive_size)
+        # Intensidad de la mutación decreciente (0 = sin mutación)
+        self.mutation_rate = mutation_rate
+        # Si el archivo cambió en la última iteración (para topologías dinámicas)
+        self._archive_changed = False
+        # Rangos de Pareto de los mejores personales (None = recalcular)
+        self._ranks = None
+
+    def initialize(self, initial_position, num_particles, max_iterations):
+        super().initialize(initial_position, num_particles, max_iterations)
+        self.archive.clear()
+        self._archive_changed = False
+        self._ranks = None
+
+    def update_bests(self, errors, index=slice(None), violations=None):
+        """Actualizar mejores personales por dominancia e insertar en el archivo"""
+        # Los objetivos (N, M) se reservan con la primera evaluación, cuando se conoce M
+        if self.err_best.ndim == 1:
+            self.err_best = np.full((self.num_particles, errors.shape[1]), np.inf)
+            self.errors = np.full_like(self.err_best, np.inf)
+        positions = self.positions[index]
+        err_best = self.err_best[index]
+        pos_best = self.pos_best[index]
+        self.errors[index] = errors
+
+        # Reemplazar si domina al mejor personal; en empate de Pareto, al azar
+        better = dominates(errors, err_best)
+        tie = ~better & ~dominates(err_best, errors)
+        improved = better | (tie & (self.rng.random(len(errors)) < 0.5))
+        pos_best[improved] = positions[improved]
+        err_best[improved] = errors[improved]
+        self._improvements += int(np.count_nonzero(better))
+        if improved.any():
+            self._ranks = None
+
+        # Sólo las filas no dominadas del lote pueden entrar al archivo
+        self._archive_changed = self.archive.insert(positions, errors)
+
+    def adapt(self, previous_best):
+        """Adaptar topología y coeficientes (la mejora es un cambio en el archivo)"""
+        self.topology.update(self.rng, self._archive_changed)
+        self.success_rate = self._improvements / self.num_particles
+        self._improvements = 0
+        self.coefficients.update(self)
+
+    def personal_best_key(self):
+        """Rango de Pareto de cada mejor personal (0 = no dominado)
+
+        Se calcula una vez por cambio de los mejores personales y se reutiliza
+        en los vecindarios, best_particles e inject.
+        """
+        if self._ranks is None:
+            self._ranks = non_dominated_sort(self.err_best).astype(float)
+        return self._ranks
+
+    def neighborhood_best(self, index=slice(None)):
+        """Líder de cada fila: del archivo (gbest) o el vecino de menor rango (lbest)"""
+        if self.topology.neighbors is None:
+            count = len(self.positions[index])
+            return self.archive.select_leaders(count, self.rng)
+        return super().neighborhood_best(index)
+
+    def update_positions(self, index=slice(None)):
+        """Mover las filas `index` y aplicar la mutación decreciente"""
+        super().update_positions(index)
+        if not self.mutation_rate:
+            return
+        # Sin max_iterations la mutación se mantiene con su probabilidad inicial
+        progress = 0.0 if self.max_iterations is None else \
+            min(1.0, self.current_iteration / self.max_iterations)
+        probability = (1.0 - progress) ** (5.0 / self.mutation_rate)
+        positions = self.positions[index]
+        rows = np.flatnonzero(self.rng.random(len(positions)) < probability)
+        if not rows.size:
+            return
+        # Una dimensión al azar por partícula, re-muestreada en un rango que se contrae
+        dims = self.rng.integers(0, self.num_dimensions, size=len(rows))
+        lower, upper = self.lower_bounds[dims], self.upper_bounds[dims]
+        width = (upper - lower) * probability
+        values = positions[rows, dims]
+        positions[rows, dims] = self.rng.uniform(np.maximum(values - width, lower),
+                                                 np.minimum(values + width, upper))
+
+    def inject(self, positions, errors):
+        """Reemplazar las partículas de peor rango por inmigrantes y agregarlos al archivo"""
+        count = min(len(positions), self.num_particles)
+        positions = np.asarray(positions[:count], dtype=self.dtype)
+        errors = np.asarray(errors[:count], dtype=float)
+        worst = np.argpartition(-self.personal_best_key(), count - 1)[:count]
+        self.positions[worst] = positions
+        self.pos_best[worst] = positions
+        self.err_best[worst] = errors
+        self.errors[worst] = errors
+        self._ranks = None
+        self.archive.insert(positions, errors)
+
+    async def run_async(self, max_concurrency=None, executor=None):
+        raise ValueError("La opción 'run_async' no está soportada en modo multiobjetivo")
+
+    def checkpoint_state(self):
+        """Guardar el archivo de Pareto junto con el enjambre"""
+        if not len(self.archive):
+            return {}
+        return {
+            'archive_positions': self.archive.positions,
+            'archive_objectives': self.archive.objectives,
+        }
+
+    def restore_checkpoint_state(self, data):
+        self._ranks = None
+        self.archive.clear()
+        if 'archive_objectives' in data:
+            self.archive.positions = data['archive_positions'].astype(self.dtype, copy=False)
+            self.archive.objectives = data['archive_objectives']
+            self.archive.crowding = crowding_distance(self.archive.objectives)
+
+    def get_stats(self):
+        """Estadísticas del motor más el frente de Pareto (ordenado por el primer objetivo)"""
+        stats = super().get_stats()
+        front = {'archive_size': 0, 'pareto_front': [], 'pareto_set': []}
+        if len(self.archive):
+            order = np.argsort(self.archive.objectives[:, 0], kind='stable')
+            front = {
+                'archive_size': len(self.archive),                            # Soluciones en el archivo
+                'pareto_front': self.archive.objectives[order].tolist(),      # Objetivos del frente
+                'pareto_set': self.archive.positions[order].tolist(),         # Posiciones del frente
+            }
+        stats.update(front)
+        return stats
@@ -0,0 +1,142 @@
+"""
+PSO - Instrumentación opcional de las fases del motor
+Archivo: profiling.py
+
+El motor mide cada fase de step() con `with profiler.phase(nombre):`. Por
+defecto usa NULL_PROFILER, cuyas fases son un único contexto vacío
+compartido: desactivado, el costo es una llamada a método por fase. Con
+un Profiler se acumulan tiempos por fase, el conteo de evaluaciones y un
+histograma logarítmico de la latencia de cada llamada a la función de costo.
+
+La latencia se mide alrededor de la llamada misma, en el hilo o proceso
+que la ejecuta (ver evaluators.timed_evaluate_chunk): una muestra por
+partícula con funciones escalares y una por bloque con funciones batch, en
+modo síncrono y asíncrono por igual.
+"""
+
+# Importar math para el índice logarítmico del histograma
+import math
+# Importar time para el reloj de alta resolución
+import time
+from contextlib import nullcontext
+
+
+class _PhaseTimer:
+    """Contexto reutilizable que suma el tiempo transcurrido a una fase"""
+
+    __slots__ = ('totals', 'start')
+
+    def __init__(self, totals):
+        # [tiempo total (s), llamadas, máximo (s)] de la fase
+        self.totals = totals
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        totals = self.totals
+        totals[0] += elapsed
+        totals[1] += 1
+        if elapsed > totals[2]:
+            totals[2] = elapsed
+
+
+class NullProfiler:
+    """Instrumentación desactivada (por defecto): no mide nada"""
+
+    enabled = False
+    _context = nullcontext()
+
+    def phase(self, name):
+        return self._context
+
+    def record_evaluation(self, count, elapsed):
+        pass
+
+    def reset(self):
+        pass
+
+
+# Instancia compartida usada por los motores sin instrumentación
+NULL_PROFILER = NullProfiler()
+
+
+class Profiler(NullProfiler):
+    """Tiempos por fase, evaluaciones e histograma de latencias de la función de costo
+
+    El histograma usa `bins_per_decade` intervalos por década entre
+    `min_latency` y `max_latency` segundos (los extremos acumulan lo que
+    queda fuera del rango).
+    """
+
+    enabled = True
+
+    def __init__(self, bins_per_decade=4, min_latency=1e-7, max_latency=100.0):
+        self.bins_per_decade = bins_per_decade
+        self.min_latency = min_latency
+        decades = math.log10(max_latency / min_latency)
+        self.num_bins = int(math.ceil(decades * bins_per_decade))
+        self.reset()
+
+    def reset(self):
+        """Vaciar tiempos, contadores e histograma"""
+        self._phases = {}
+        self._timers = {}
+        self.evaluation_calls = 0
+        self.evaluated_points = 0
+        self.latency_counts = [0] * self.num_bins
+
+    def phase(self, name):
+        """Contexto que mide una fase (un temporizador reutilizable por nombre)"""
+        timer = self._timers.get(name)
+        if timer is None:
+            self._phases[name] = [0.0, 0, 0.0]
+            timer = self._timers[name] = _PhaseTimer(self._phases[name])
+        return timer
+
+    def record_evaluation(self, count, elapsed):
+        """Registrar una llamada a la función de costo con `count` puntos"""
+        self.evaluation_calls += 1
+        self.evaluated_points += count
+        if elapsed > self.min_latency:
+            index = int(math.log10(elapsed / self.min_latency) * self.bins_per_decade)
+        else:
+            index = 0
+        self.latency_counts[min(index, self.num_bins - 1)] += 1
+
+    def bin_edges(self, index):
+        """Límites (inferior, superior) en segundos del intervalo `index` del histograma"""
+        step = 1.0 / self.bins_per_decade
+        return (self.min_latency * 10 ** (index * step),
+                self.min_latency * 10 ** ((index + 1) * step))
+
+    def get_stats(self):
+        """Obtener tiempos por fase, evaluaciones e histograma (sólo intervalos no vacíos)"""
+        phases = {}
+        for name, (total, calls, maximum) in list(self._phases.items()):
+            phases[name] = {
+                'calls': calls,
+                'total_s': total,
+                'mean_ms': 1000 * total / calls if calls else 0.0,
+                'max_ms': 1000 * maximum,
+            }
+        return {
+            'phases': phases,
+            'evaluation_calls': self.evaluation_calls,
+            'evaluated_points': self.evaluated_points,
+            'latency_histogram': [[*self.bin_edges(i), count]
+                                  for i, count in enumerate(self.latency_counts) if count],
+        }
+
+
+def format_profile(profile):
+    """Texto de una línea por fase: tiempo medio por llamada y porcentaje del total"""
+    phases = profile['phases']
+    total = sum(p['total_s'] for p in phases.values()) or 1.0
+    lines = [f"{name:<14}{p['mean_ms']:8.3f} ms {100 * p['total_s'] / total:5.1f}%"
+             for name, p in sorted(phases.items(), key=lambda item: -item[1]['total_s'])]
+    lines.append(f"{'evaluaciones':<14}{profile['evaluated_points']:>8} en "
+                 f"{profile['evaluation_calls']} llamadas")
+    return '\n'.join(lines)
@@ -0,0 +1,122 @@
+"""
+PSO - Proyecciones 2D del espacio de búsqueda para visualizar D > 2
+Archivo: projection.py
+
+Una proyección se describe con un centro (D,) y dos componentes (2, D):
+    project(X) = (X - center) @ components.T
+y permite "levantar" puntos del plano a un corte del espacio completo que
+pasa por un punto ancla (p. ej. el mejor global):
+    lift(U, anchor) = anchor + (U - project(anchor)) @ components
+"""
+
+# Importar NumPy para el álgebra lineal
+import numpy as np
+
+# Importar la evaluación por bloques (batch o escalar)
+from evaluators import evaluate_chunk
+
+
+class AxisProjection:
+    """Proyección sobre dos ejes coordenados elegidos"""
+
+    def __init__(self, num_dimensions, axes=(0, 1)):
+        self.num_dimensions = num_dimensions
+        self.axes = tuple(axes)
+        # Centro en el origen y componentes = vectores unitarios de los ejes
+        self.center = np.zeros(num_dimensions)
+        self.components = np.zeros((2, num_dimensions))
+        self.components[0, self.axes[0]] = 1.0
+        self.components[1, self.axes[1]] = 1.0
+
+    @property
+    def labels(self):
+        """Etiquetas de los ejes del gráfico"""
+        return f'x{self.axes[0]}', f'x{self.axes[1]}'
+
+    def update(self, positions):
+        """Actualizar la proyección con el enjambre actual (fija para ejes coordenados)"""
+        return False
+
+    def project(self, X):
+        """Proyectar filas (n, D) al plano (n, 2)"""
+        return (np.asarray(X) - self.center) @ self.components.T
+
+    def lift(self, U, anchor):
+        """Llevar puntos del plano (n, 2) al corte que pasa por `anchor`"""
+        return anchor + (U - self.project(anchor)) @ self.components
+
+    def box_extent(self, lower, upper):
+        """Rango (mín, máx) de la caja de búsqueda proyectada en cada eje del plano"""
+        middle = (self.project((lower + upper) / 2))
+        half = np.abs(self.components) @ ((upper - lower) / 2)
+        return np.stack([middle - half, middle + half], axis=1)
+
+
+class PCAProjection(AxisProjection):
+    """Proyección PCA calculada de forma incremental sobre la matriz de posiciones
+
+    La media y la matriz de dispersión se acumulan por lotes (fusión de
+    Chan et al.) con un factor de olvido `decay`, para seguir al enjambre a
+    medida que converge. Para acotar el costo O(n·D²), cada actualización
+    usa como máximo `max_samples` filas y sólo se procesa una de cada
+    `refresh_every` llamadas.
+    """
+
+    def __init__(self, num_dimensions, refresh_every=5, decay=0.8, max_samples=1000, seed=None):
+        super().__init__(num_dimensions)
+        self.refresh_every = refresh_every
+        self.decay = decay
+        self.max_samples = max_samples
+        self._rng = np.random.default_rng(seed)
+        self._calls = 0
+        # Estadísticos acumulados: peso total, media y matriz de dispersión
+        self._count = 0.0
+        self._mean = np.zeros(num_dimensions)
+        self._scatter = np.zeros((num_dimensions, num_dimensions))
+
+    @property
+    def labels(self):
+        return 'PC1', 'PC2'
+
+    def update(self, positions):
+        """Acumular el lote y recalcular las componentes (retorna True si cambiaron)"""
+        self._calls += 1
+        if (self._calls - 1) % self.refresh_every != 0:
+            return False
+        # Submuestrear el enjambre para limitar el costo por actualización
+        if len(positions) > self.max_samples:
+            positions = positions[self._rng.choice(len(positions), self.max_samples, replace=False)]
+        n = len(positions)
+        batch_mean = positions.mean(axis=0)
+        centered = positions - batch_mean
+        # Olvidar parcialmente la historia y fusionar el lote
+        self._count *= self.decay
+        self._scatter *= self.decay
+        delta = batch_mean - self._mean
+        total = self._count + n
+        self._scatter += centered.T @ centered + np.outer(delta, delta) * (self._count * n / total)
+        self._mean += delta * (n / total)
+        self._count = total
+        # Dos autovectores de mayor autovalor (eigh los ordena de forma ascendente)
+        _, vectors = np.linalg.eigh(self._scatter)
+        components = vectors[:, [-1, -2]].T
+        # Fijar el signo para que la vista no "salte" entre actualizaciones
+        signs = np.sign(components[np.arange(2), np.abs(components).argmax(axis=1)])
+        self.components = components * signs[:, np.newaxis]
+        self.center = self._mean.copy()
+        return True
+
+
+def evaluate_slice(cost_function, projection, anchor, extent, lower, upper, resolution=60):
+    """Evaluar la función de costo en una rejilla del plano proyectado
+
+    La rejilla se levanta al corte que pasa por `anchor` y se recorta a los
+    límites de búsqueda. Retorna (U, V, Z) listos para contourf.
+    """
+    u = np.linspace(extent[0, 0], extent[0, 1], resolution)
+    v = np.linspace(extent[1, 0], extent[1, 1], resolution)
+    U, V = np.meshgrid(u, v)
+    points = projection.lift(np.column_stack([U.ravel(), V.ravel()]), anchor)
+    np.clip(points, lower, upper, out=points)
+    Z = evaluate_chunk(cost_function, points).reshape(U.shape)
+    return U, V, Z
@@ -0,0 +1,130 @@
+"""
+PSO - Modelos sustitutos para pre-filtrar evaluaciones costosas
+Archivo: surrogate.py
+
+Un sustituto aprende del archivo de evaluaciones reales y predice el error
+de las posiciones candidatas. En cada iteración el motor le pasa las filas
+que requieren el objetivo y el sustituto elige la fracción más prometedora
+(mayor mejora predicha sobre el mejor personal); el resto no llega a la
+función de costo y se trata como "sin mejora" en esa iteración.
+
+El archivo es un búfer circular preasignado: agregar evaluaciones es el
+único reentrenamiento necesario (incremental, O(n·D) por lote).
+"""
+
+# Importar math para redondear la fracción evaluada
+import math
+# Importar NumPy para las distancias vectorizadas
+import numpy as np
+
+
+class KNNSurrogate:
+    """Predicción por k vecinos más cercanos con ponderación inversa a la distancia
+
+    Las distancias se calculan con una sola multiplicación de matrices
+    (|x|² + |a|² - 2·x·a) contra el archivo, cuyo tamaño se acota con
+    `max_archive` para fijar el costo por iteración en O(N·max_archive·D).
+    """
+
+    def __init__(self, k=5, fraction=0.5, min_samples=None, max_archive=5000):
+        # Vecinos usados en cada predicción
+        self.k = k
+        # Fracción de candidatos que se envía al objetivo real
+        self.fraction = fraction
+        # Evaluaciones reales necesarias antes de empezar a filtrar
+        self.min_samples = min_samples if min_samples is not None else 4 * k
+        # Tamaño máximo del archivo (las evaluaciones más antiguas se descartan)
+        self.max_archive = max_archive
+        self.reset()
+
+    def reset(self):
+        """Vaciar el archivo y los contadores"""
+        # El archivo se reserva con el primer lote, cuando se conoce D
+        self._positions = None
+        self._errors = np.empty(0)
+        self._sq_norms = np.empty(0)
+        self.size = 0
+        self._next = 0
+        # Candidatos evaluados por el sustituto y candidatos descartados sin evaluar
+        self.predictions = 0
+        self.skipped = 0
+
+    def add(self, positions, errors):
+        """Agregar evaluaciones reales al archivo (entrenamiento incremental)"""
+        finite = np.isfinite(errors)
+        positions, errors = positions[finite], errors[finite]
+        if self._positions is None:
+            self._positions = np.empty((self.max_archive, positions.shape[1]))
+            self._errors = np.empty(self.max_archive)
+            self._sq_norms = np.empty(self.max_archive)
+        # Ranuras circulares a escribir (las más antiguas se sobrescriben)
+        positions, errors = positions[-self.max_archive:], errors[-self.max_archive:]
+        slots = (self._next + np.arange(len(errors))) % self.max_archive
+        self._positions[slots] = positions
+        self._errors[slots] = errors
+        self._sq_norms[slots] = np.einsum('ij,ij->i', positions, positions)
+        self._next = (self._next + len(errors)) % self.max_archive
+        self.size = min(self.size + len(errors), self.max_archive)
+
+    def ready(self):
+        """Indicar si el archivo tiene suficientes evaluaciones para predecir"""
+        return self.size >= self.min_samples
+
+    def predict(self, positions):
+        """Predecir el error de cada fila de `positions`"""
+        archive = self._positions[:self.size]
+        # Distancias al cuadrado (n, M) con una sola multiplicación de matrices
+        sq_dist = (np.einsum('ij,ij->i', positions, positions)[:, np.newaxis]
+                   + self._sq_norms[:self.size] - 2.0 * positions @ archive.T)
+        np.maximum(sq_dist, 0.0, out=sq_dist)
+        k = min(self.k, self.size)
+        nearest = np.argpartition(sq_dist, k - 1, axis=1)[:, :k]
+        dist = np.sqrt(np.take_along_axis(sq_dist, nearest, axis=1))
+        # Ponderación inversa a la distancia (un punto ya evaluado domina su predicción)
+        weights = 1.0 / (dist + 1e-12)
+        return (weights * self._errors[nearest]).sum(axis=1) / weights.sum(axis=1)
+
+    def screen(self, positions, reference):
+        """Elegir qué candidatos evaluar con el objetivo real (máscara (n,))
+
+        `reference` es el mejor error personal de cada candidato: se evalúa
+        la fracción con mayor mejora predicha. Candidatos sin mejor personal
+        (referencia infinita) se evalúan siempre.
+        """
+        selected = np.ones(len(positions), dtype=bool)
+        count = max(1, math.ceil(self.fraction * len(positions)))
+        if not self.ready() or count >= len(positions):
+            return selected
+        promise = self.predict(positions) - reference
+        self.predictions += len(positions)
+        selected[:] = False
+        selected[np.argsort(promise, kind='stable')[:count]] = True
+        # Sin mejor personal no hay con qué comparar: evaluar siempre
+        selected |= ~np.isfinite(reference)
+        self.skipped += len(positions) - int(np.count_nonzero(selected))
+        return selected
+
+    def get_stats(self):
+        """Obtener predicciones, candidatos descartados y tamaño del archivo"""
+        return {
+            'surrogate_predictions': self.predictions,
+            'surrogate_skipped': self.skipped,
+            'surrogate_archive': self.size,
+        }
+
+
+# Modelos sustitutos disponibles por nombre
+SURROGATES = {
+    'knn': KNNSurrogate,
+}
+
+
+def make_surrogate(spec):
+    """Crear un sustituto desde su nombre o desde {nombre: {argumentos}}"""
+    if isinstance(spec, dict):
+        (name, options), = spec.items()
+    else:
+        name, options = spec, {}
+    if name not in SURROGATES:
+        raise ValueError(f"Sustituto desconocido: {name!r} (opciones: {', '.join(SURROGATES)})")
+    return SURROGATES[name](**options)
@@ -0,0 +1,59 @@
+"""
+PSO - Pruebas de las estrategias de límites
+Archivo: tests/test_boundaries.py
+"""
+
+import numpy as np
+
+from boundaries import Reflect, Periodic, make_boundary
+
+
+LOWER = np.array([0.0, 0.0])
+UPPER = np.array([1.0, 1.0])
+
+
+def apply(strategy, positions, velocities):
+    positions = np.array(positions, dtype=float)
+    velocities = np.array(velocities, dtype=float)
+    strategy.apply(positions, velocities, LOWER, UPPER, np.random.default_rng(0))
+    return positions, velocities
+
+
+def test_reflect_single_crossing_flips_velocity():
+    positions, velocities = apply(Reflect(), [[1.25, -0.25]], [[1.0, -1.0]])
+    np.testing.assert_allclose(positions, [[0.75, 0.25]])
+    np.testing.assert_array_equal(velocities, [[-1.0, 1.0]])
+
+
+def test_reflect_two_wall_crossing_keeps_velocity():
+    # 2.25 cruza la pared superior y luego la inferior: termina en 0.25 avanzando
+    positions, velocities = apply(Reflect(), [[2.25, -1.25]], [[3.0, -3.0]])
+    np.testing.assert_allclose(positions, [[0.25, 0.75]])
+    np.testing.assert_array_equal(velocities, [[3.0, -3.0]])
+
+
+def test_reflect_three_wall_crossing_flips_velocity():
+    positions, velocities = apply(Reflect(), [[3.25, 0.5]], [[4.0, 1.0]])
+    np.testing.assert_allclose(positions, [[0.75, 0.5]])
+    np.testing.assert_array_equal(velocities, [[-4.0, 1.0]])
+
+
+def test_reflect_leaves_in_bounds_coordinates_untouched():
+    inside = [[0.1 + 0.2, 0.7], [1e-17, 1.0]]
+    positions, velocities = apply(Reflect(), inside, [[0.5, 0.5], [0.5, 0.5]])
+    np.testing.assert_array_equal(positions, inside)
+    np.testing.assert_array_equal(velocities, [[0.5, 0.5], [0.5, 0.5]])
+
+
+def test_periodic_wraps_into_bounds():
+    positions, _ = apply(Periodic(), [[1.25, -0.25]], [[0.0, 0.0]])
+    np.testing.assert_allclose(positions, [[0.25, 0.75]])
+
+
+def test_every_strategy_keeps_positions_in_bounds():
+    rng = np.random.default_rng(1)
+    for name in ('clamp', 'absorb', 'reflect', 'periodic', 'random'):
+        positions = rng.uniform(-3.0, 4.0, size=(50, 2))
+        velocities = rng.normal(size=(50, 2))
+        make_boundary(name).apply(positions, velocities, LOWER, UPPER, rng)
+        assert np.all(positions >= LOWER) and np.all(positions <= UPPER), name
@@ -0,0 +1,67 @@
+"""
+PSO - Pruebas de checkpoint y reanudación
+Archivo: tests/test_checkpoint.py
+"""
+
+import numpy as np
+import pytest
+
+from logic import PSOEngine, rastrigin
+from criteria import Stagnation
+
+
+def make_engine(**options):
+    engine = PSOEngine(rastrigin, [(-5.12, 5.12)] * 4, seed=3, **options)
+    engine.initialize([1.0] * 4, 20, 60)
+    return engine
+
+
+def run_to_end(engine):
+    while engine.step():
+        pass
+    return engine
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    path = tmp_path / 'ck.npz'
+    full = run_to_end(make_engine())
+    interrupted = make_engine()
+    for _ in range(25):
+        interrupted.step()
+    interrupted.save_checkpoint(path)
+    resumed = make_engine()
+    resumed.load_checkpoint(path)
+    run_to_end(resumed)
+    assert resumed.current_iteration == full.current_iteration
+    assert resumed.err_best_g == full.err_best_g
+    np.testing.assert_array_equal(resumed.positions, full.positions)
+    np.testing.assert_array_equal(resumed.pos_best_g, full.pos_best_g)
+
+
+def test_resume_keeps_stagnation_state(tmp_path):
+    path = tmp_path / 'ck.npz'
+    full = run_to_end(make_engine(termination=[Stagnation(5)]))
+    assert full.stop_reason.startswith('stagnation')
+    interrupted = make_engine(termination=[Stagnation(5)])
+    for _ in range(full.current_iteration - 2):
+        interrupted.step()
+    interrupted.save_checkpoint(path)
+    resumed = make_engine(termination=[Stagnation(5)])
+    resumed.load_checkpoint(path)
+    run_to_end(resumed)
+    assert resumed.current_iteration == full.current_iteration
+    assert resumed.stop_reason == full.stop_reason
+
+
+def test_load_rejects_different_swarm_size(tmp_path):
+    path = tmp_path / 'ck.npz'
+    make_engine().save_checkpoint(path)
+    engine = PSOEngine(rastrigin, [(-5.12, 5.12)] * 4, seed=3)
+    engine.initialize([1.0] * 4, 10, 60)
+    with pytest.raises(ValueError):
+        engine.load_checkpoint(path)
+
+
+def test_checkpoint_every_requires_path():
+    with pytest.raises(ValueError):
+        PSOEngine(rastrigin, [(-5.12, 5.12)] * 2, checkpoint_every=5)
@@ -0,0 +1,45 @@
+"""
+PSO - Pruebas del historial de trayectorias
+Archivo: tests/test_history.py
+"""
+
+import numpy as np
+
+from history import TrajectoryHistory, load_history
+from logic import IterationRecord
+
+
+def record(iteration):
+    positions = np.full((3, 2), float(iteration))
+    return IterationRecord(iteration, float(iteration), positions[0], 0, positions, positions)
+
+
+def fill(history, iterations):
+    for iteration in iterations:
+        history.record(record(iteration))
+
+
+def test_ring_buffer_keeps_latest_samples():
+    history = TrajectoryHistory(5)
+    fill(history, range(1, 13))
+    assert len(history) == 5
+    assert [i for i, _, _ in history.replay()] == [8, 9, 10, 11, 12]
+
+
+def test_resume_after_wrap_counts_only_valid_samples(tmp_path):
+    path = str(tmp_path / 'h.npy')
+    history = TrajectoryHistory(5, path=path)
+    fill(history, range(1, 13))
+    history.close()
+    resumed = TrajectoryHistory(5, path=path)
+    assert resumed.resume(9)
+    assert len(resumed) == 2
+    assert [i for i, _, _ in resumed.replay()] == [8, 9]
+    fill(resumed, range(10, 15))
+    assert len(resumed) == 5
+    resumed.close()
+    assert [i for i, _, _ in load_history(path).replay()] == [10, 11, 12, 13, 14]
+
+
+def test_resume_without_file_returns_false(tmp_path):
+    assert not TrajectoryHistory(5, path=str(tmp_path / 'missing.npy')).resume(3)
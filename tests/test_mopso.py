@@ -0,0 +1,66 @@
+"""
+PSO - Pruebas del ordenamiento de Pareto y del motor multiobjetivo
+Archivo: tests/test_mopso.py
+"""
+
+import numpy as np
+import pytest
+
+from mopso import (MOPSOEngine, ParetoArchive, dominates, non_dominated_mask,
+                   non_dominated_sort, zdt1)
+from criteria import Stagnation, TargetError
+
+
+def brute_force_ranks(objectives):
+    """Rango por definición: 0 si nadie domina; si no, 1 + el mayor rango de sus dominadores"""
+    n = len(objectives)
+    dominated_by = [[i for i in range(n) if dominates(objectives[i], objectives[j])]
+                    for j in range(n)]
+    ranks = [None] * n
+    while None in ranks:
+        for j in range(n):
+            if ranks[j] is None and all(ranks[i] is not None for i in dominated_by[j]):
+                ranks[j] = 1 + max((ranks[i] for i in dominated_by[j]), default=-1)
+    return np.array(ranks)
+
+
+@pytest.mark.parametrize('num_objectives', [2, 3, 4])
+def test_non_dominated_sort_matches_brute_force(num_objectives):
+    rng = np.random.default_rng(num_objectives)
+    for _ in range(30):
+        n = int(rng.integers(1, 40))
+        # Valores enteros para provocar empates y filas repetidas
+        objectives = rng.integers(0, 5, size=(n, num_objectives)).astype(float)
+        np.testing.assert_array_equal(non_dominated_sort(objectives),
+                                      brute_force_ranks(objectives))
+
+
+def test_non_dominated_mask_is_first_front():
+    objectives = np.random.default_rng(0).random((60, 3))
+    np.testing.assert_array_equal(non_dominated_mask(objectives),
+                                  non_dominated_sort(objectives) == 0)
+
+
+def test_archive_respects_capacity_and_keeps_extremes():
+    f1 = np.linspace(0.0, 1.0, 50)
+    objectives = np.column_stack([f1, 1.0 - f1])
+    archive = ParetoArchive(capacity=10)
+    archive.insert(objectives.copy(), objectives)
+    assert len(archive) == 10
+    assert {0.0, 1.0} <= set(archive.objectives[:, 0].tolist())
+
+
+@pytest.mark.parametrize('criterion', [TargetError(0.1), Stagnation(5)])
+def test_rejects_best_error_criteria(criterion):
+    with pytest.raises(ValueError):
+        MOPSOEngine(zdt1, [(0.0, 1.0)] * 3, termination=[criterion])
+
+
+def test_zdt1_front_is_non_dominated():
+    engine = MOPSOEngine(zdt1, [(0.0, 1.0)] * 5, seed=1, archive_size=30)
+    engine.initialize([0.5] * 5, 30, 60)
+    while engine.step():
+        pass
+    front = np.array(engine.get_stats()['pareto_front'])
+    assert len(front) == 30
+    assert non_dominated_mask(front).all()
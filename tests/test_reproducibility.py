@@ -0,0 +1,38 @@
+"""
+PSO - Pruebas de reproducibilidad entre backends de evaluación
+Archivo: tests/test_reproducibility.py
+"""
+
+import numpy as np
+import pytest
+
+from logic import PSOEngine, func1, rastrigin
+
+
+def run(cost_function, evaluator, seed=7):
+    engine = PSOEngine(cost_function, [(-5.12, 5.12)] * 3, evaluator=evaluator, seed=seed)
+    try:
+        engine.initialize([2.0] * 3, 16, 25)
+        while engine.step():
+            pass
+        return engine.err_best_g, engine.pos_best_g.copy(), engine.positions.copy()
+    finally:
+        engine.close()
+
+
+@pytest.mark.parametrize('cost_function', [rastrigin, func1])
+@pytest.mark.parametrize('evaluator', ['thread', 'process'])
+def test_backends_match_serial(cost_function, evaluator):
+    error, best, positions = run(cost_function, 'serial')
+    other_error, other_best, other_positions = run(cost_function, evaluator)
+    assert other_error == error
+    np.testing.assert_array_equal(other_best, best)
+    np.testing.assert_array_equal(other_positions, positions)
+
+
+def test_same_seed_same_result_and_different_seed_differs():
+    first = run(rastrigin, 'serial', seed=11)
+    second = run(rastrigin, 'serial', seed=11)
+    other = run(rastrigin, 'serial', seed=12)
+    np.testing.assert_array_equal(first[2], second[2])
+    assert not np.array_equal(first[2], other[2])
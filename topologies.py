@@ -0,0 +1,105 @@
+"""
+PSO - Topologías de vecindario (gbest y lbest)
+Archivo: topologies.py
+
+Cada topología precalcula una matriz de índices de vecinos (N, k) que
+incluye a la propia partícula. El motor obtiene el mejor de cada
+vecindario con una sola indexación vectorizada (costo O(N·k)). La
+topología global (gbest) no usa vecinos: todas siguen a pos_best_g.
+"""
+
+# Importar NumPy para construir los índices de vecinos
+import numpy as np
+
+
+class GlobalTopology:
+    """Topología gbest - Todas las partículas siguen al mejor global"""
+
+    def __init__(self):
+        # Sin matriz de vecinos: el motor usa pos_best_g directamente
+        self.neighbors = None
+
+    def reset(self, num_particles, rng):
+        """Precalcular los vecinos para un enjambre de `num_particles` partículas"""
+        pass
+
+    def update(self, rng, improved):
+        """Actualizar los vecinos tras una iteración (`improved`: si mejoró el global)"""
+        pass
+
+
+class RingTopology(GlobalTopology):
+    """Topología en anillo - Cada partícula ve a sus `k` vecinas a cada lado"""
+
+    def __init__(self, k=1):
+        super().__init__()
+        self.k = k
+
+    def reset(self, num_particles, rng):
+        offsets = np.arange(-self.k, self.k + 1)
+        self.neighbors = (np.arange(num_particles)[:, np.newaxis] + offsets) % num_particles
+
+
+class VonNeumannTopology(GlobalTopology):
+    """Topología de von Neumann - Rejilla toroidal con vecinos arriba, abajo, izquierda y derecha
+
+    La rejilla usa el número de filas divisor de N más cercano a sqrt(N).
+    """
+
+    def reset(self, num_particles, rng):
+        rows = max(r for r in range(1, int(np.sqrt(num_particles)) + 1) if num_particles % r == 0)
+        cols = num_particles // rows
+        index = np.arange(num_particles)
+        row, col = index // cols, index % cols
+        self.neighbors = np.stack([
+            index,
+            ((row - 1) % rows) * cols + col,
+            ((row + 1) % rows) * cols + col,
+            row * cols + (col - 1) % cols,
+            row * cols + (col + 1) % cols,
+        ], axis=1)
+
+
+class RandomTopology(GlobalTopology):
+    """Topología aleatoria dinámica - Cada partícula ve a `k` partículas al azar
+
+    Los vecinos se vuelven a sortear tras cada iteración en la que el mejor
+    global no mejora (topología adaptativa de Clerc).
+    """
+
+    def __init__(self, k=3):
+        super().__init__()
+        self.k = k
+
+    def reset(self, num_particles, rng):
+        self.num_particles = num_particles
+        self._draw(rng)
+
+    def update(self, rng, improved):
+        if not improved:
+            self._draw(rng)
+
+    def _draw(self, rng):
+        """Sortear k vecinos por partícula (además de ella misma)"""
+        others = rng.integers(0, self.num_particles, size=(self.num_particles, self.k))
+        self.neighbors = np.column_stack([np.arange(self.num_particles), others])
+
+
+# Topologías disponibles por nombre
+TOPOLOGIES = {
+    'global': GlobalTopology,
+    'ring': RingTopology,
+    'von_neumann': VonNeumannTopology,
+    'random': RandomTopology,
+}
+
+
+def make_topology(spec):
+    """Crear una topología desde su nombre o desde {nombre: {argumentos}}"""
+    if isinstance(spec, dict):
+        (name, options), = spec.items()
+    else:
+        name, options = spec, {}
+    if name not in TOPOLOGIES:
+        raise ValueError(f"Topología desconocida: {name!r} (opciones: {', '.join(TOPOLOGIES)})")
+    return TOPOLOGIES[name](**options)